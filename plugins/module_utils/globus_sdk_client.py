@@ -27,6 +27,11 @@ else:
     from globus_sdk import ComputeClient
 
 
+def unwrap_response(response: t.Any) -> t.Any:
+    """Return the parsed body of an SDK response, or the value itself if unwrapped."""
+    return getattr(response, "data", response)
+
+
 class GlobusSDKClient(GlobusModuleBase):
     """Globus SDK client wrapper for Ansible modules."""
 
@@ -493,7 +498,7 @@ class GlobusSDKClient(GlobusModuleBase):
         try:
             assert self.transfer_client is not None, "Transfer client not initialized"
             response = self.transfer_client.get(endpoint, query_params=params)
-            return response.data if hasattr(response, "data") else response
+            return unwrap_response(response)
         except Exception as e:
             self.handle_api_error(e, f"GET {endpoint}")
             return {}
@@ -505,7 +510,7 @@ class GlobusSDKClient(GlobusModuleBase):
         try:
             assert self.transfer_client is not None, "Transfer client not initialized"
             response = self.transfer_client.post(endpoint, data=data)
-            return response.data if hasattr(response, "data") else response
+            return unwrap_response(response)
         except Exception as e:
             self.handle_api_error(e, f"POST {endpoint}")
             return {}
@@ -517,7 +522,7 @@ class GlobusSDKClient(GlobusModuleBase):
         try:
             assert self.transfer_client is not None, "Transfer client not initialized"
             response = self.transfer_client.put(endpoint, data=data)
-            return response.data if hasattr(response, "data") else response
+            return unwrap_response(response)
         except Exception as e:
             self.handle_api_error(e, f"PUT {endpoint}")
             return {}
@@ -104,16 +104,35 @@ from ansible_collections.m1yag1.globus.plugins.module_utils.globus_common import
 )
 from ansible_collections.m1yag1.globus.plugins.module_utils.globus_sdk_client import (
     GlobusSDKClient,
+    unwrap_response,
 )
 
 
-def find_index_by_name(api, name):
-    """Find search index by display name (returns first match or None)."""
+def _is_http_status(error, code):
+    """Check whether an SDK error carries the given HTTP status code."""
+    return getattr(error, "http_status", None) == code
+
+
+def list_indexes(api):
+    """List all search indexes visible to the caller."""
+    try:
+        return list(api.search_client.index_list())
+    except Exception as e:
+        api.handle_api_error(e, "listing search indexes")
+
+
+def find_index_by_name(api, name, indexes=None):
+    """Find search index by display name (returns first match or None).
+
+    Pass ``indexes`` from ``list_indexes`` to reuse an existing listing.
+    """
     try:
-        for index in api.search_client.index_list():
-            if index.get("display_name") == name:
-                return index
-        return None
+        if indexes is None:
+            indexes = api.search_client.index_list()
+        return next(
+            (index for index in indexes if index.get("display_name") == name),
+            None,
+        )
     except Exception as e:
         api.handle_api_error(e, f"searching for index '{name}'")
 
@@ -122,29 +141,30 @@ def get_index_by_id(api, index_id):
     """Get search index by UUID (returns None if not found)."""
     try:
         response = api.search_client.get_index(index_id)
-        return response.data if hasattr(response, "data") else response
+        return unwrap_response(response)
     except Exception as e:
-        if hasattr(e, "http_status") and e.http_status == 404:
+        if _is_http_status(e, 404):
             return None
         api.handle_api_error(e, f"retrieving index '{index_id}'")
 
 
-def check_trial_limit(api):
-    """Check trial index count (max 3)."""
-    try:
-        trial_count = 0
-        for index in api.search_client.index_list():
-            if index.get("is_trial", False):
-                trial_count += 1
+def check_trial_limit(api, indexes=None):
+    """Check trial index count (max 3).
 
+    Pass ``indexes`` from ``list_indexes`` to reuse an existing listing.
+    """
+    try:
+        if indexes is None:
+            indexes = api.search_client.index_list()
+        trial_count = sum(1 for index in indexes if index.get("is_trial", False))
         return {"count": trial_count, "limit": 3}
     except Exception as e:
         api.handle_api_error(e, "checking trial index limit")
 
 
-def create_index(api, params):
+def create_index(api, params, indexes=None):
     """Create new search index."""
-    trial_status = check_trial_limit(api)
+    trial_status = check_trial_limit(api, indexes)
     if trial_status["count"] >= trial_status["limit"]:
         api.fail_json(
             msg=f"Cannot create index: You have {trial_status['count']} trial indexes "
@@ -157,7 +177,7 @@ def create_index(api, params):
             display_name=params["name"],
             description=params.get("description", ""),
         )
-        return response.data if hasattr(response, "data") else response
+        return unwrap_response(response)
     except Exception as e:
         api.handle_api_error(e, "creating search index")
 
@@ -192,14 +212,11 @@ def delete_index(api, index_id):
         return True
     except Exception as e:
         # If index doesn't exist (404), treat as already deleted
-        if hasattr(e, "http_status") and e.http_status == 404:
+        if _is_http_status(e, 404):
             return False  # No change needed, already gone
         # If index is already being deleted (409 - delete_pending status), treat as idempotent
-        if hasattr(e, "http_status") and e.http_status == 409:
-            # Check if it's the delete_pending conflict specifically
-            error_msg = str(e)
-            if "delete_pending" in error_msg.lower():
-                return False  # No change needed, deletion already in progress
+        if _is_http_status(e, 409) and "delete_pending" in str(e).lower():
+            return False  # No change needed, deletion already in progress
         # For other errors, use standard error handling
         api.handle_api_error(e, f"deleting index '{index_id}'")
 
@@ -227,42 +244,31 @@ def main():
     result = {"changed": changed, "name": name}
 
     if state == "present":
+        # List once: the name lookup and trial limit check share the result
+        indexes = list_indexes(api)
+
         # Find if index with this name already exists
-        existing_index = find_index_by_name(api, name)
+        existing_index = find_index_by_name(api, name, indexes)
 
         if existing_index:
-            # Index exists - check for updates
-            if module.check_mode:
-                # In check mode, just validate we could update
-                changed = update_index(
-                    api, existing_index["id"], module.params, existing_index
-                )
-                result.update(
-                    {
-                        "changed": changed,
-                        "index_id": existing_index["id"],
-                        "description": existing_index.get("description", ""),
-                        "is_trial": existing_index.get("is_trial", True),
-                    }
-                )
-            else:
-                # Not in check mode - try to update
-                changed = update_index(
-                    api, existing_index["id"], module.params, existing_index
-                )
-                result.update(
-                    {
-                        "changed": changed,
-                        "index_id": existing_index["id"],
-                        "description": existing_index.get("description", ""),
-                        "is_trial": existing_index.get("is_trial", True),
-                    }
-                )
+            # Index exists - check for updates. update_index only validates
+            # and never modifies the index, so it is safe in check mode too.
+            changed = update_index(
+                api, existing_index["id"], module.params, existing_index
+            )
+            result.update(
+                {
+                    "changed": changed,
+                    "index_id": existing_index["id"],
+                    "description": existing_index.get("description", ""),
+                    "is_trial": existing_index.get("is_trial", True),
+                }
+            )
         else:
             # Index doesn't exist - create it
             if module.check_mode:
                 # In check mode, validate we could create (check trial limit)
-                trial_status = check_trial_limit(api)
+                trial_status = check_trial_limit(api, indexes)
                 if trial_status["count"] >= trial_status["limit"]:
                     module.fail_json(
                         msg=f"Cannot create index: You have {trial_status['count']} trial indexes "
@@ -281,19 +287,21 @@ def main():
                 )
             else:
                 # Not in check mode - actually create
-                new_index = create_index(api, module.params)
+                new_index = create_index(api, module.params, indexes)
                 changed = True
 
-                # Get trial count to include in response
-                trial_status = check_trial_limit(api)
+                # Derive the trial count from the pre-create listing rather
+                # than listing every index again
+                is_trial = new_index.get("is_trial", True)
+                trial_count = check_trial_limit(api, indexes)["count"] + int(is_trial)
 
                 result.update(
                     {
                         "changed": changed,
                         "index_id": new_index["id"],
                         "description": new_index.get("description", ""),
-                        "is_trial": new_index.get("is_trial", True),
-                        "trial_count": trial_status["count"],
+                        "is_trial": is_trial,
+                        "trial_count": trial_count,
                     }
                 )
 
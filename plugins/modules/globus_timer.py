@@ -179,34 +179,54 @@ from ansible_collections.m1yag1.globus.plugins.module_utils.globus_common import
 )
 from ansible_collections.m1yag1.globus.plugins.module_utils.globus_sdk_client import (
     GlobusSDKClient,
+    unwrap_response,
 )
 
+# Default lead time for one-time timers without an explicit datetime
+_DEFAULT_FUTURE = timedelta(hours=1)
+
+# Seconds per unit for the interval_* schedule options, in precedence order
+_INTERVAL_MULTIPLIERS = {
+    "interval_seconds": 1,
+    "interval_minutes": 60,
+    "interval_hours": 3600,
+    "interval_days": 86400,
+}
+
+
+def _compute_interval(schedule_params):
+    """Return the schedule interval in seconds, or None if none is specified."""
+    # Omitted suboptions are present with a None value, so skip those
+    return next(
+        (
+            schedule_params[key] * multiplier
+            for key, multiplier in _INTERVAL_MULTIPLIERS.items()
+            if schedule_params.get(key) is not None
+        ),
+        None,
+    )
+
 
 def find_timer_by_name(api, name):
     """Find a timer by name using SDK."""
     try:
         response = api.timers_client.list_jobs()
-        timers = (
-            response.data.get("jobs", [])
-            if hasattr(response, "data")
-            else response.get("jobs", [])
-        )
-
-        for timer in timers:
-            # Timers/Jobs have a 'name' field
-            timer_name = timer.get("name")
-            if timer_name == name:
-                # Use job_id (normalize to timer_id for consistency)
-                timer_id = timer.get("job_id") or timer.get("timer_id")
-                full_timer = api.timers_client.get_job(timer_id)
-                result = full_timer.data if hasattr(full_timer, "data") else full_timer
-
-                # Normalize job_id to timer_id for consistent interface
-                if "job_id" in result and "timer_id" not in result:
-                    result["timer_id"] = result["job_id"]
-
-                return result
-        return None
+        timers = unwrap_response(response).get("jobs", [])
+
+        # Timers/Jobs have a 'name' field
+        timer = next((t for t in timers if t.get("name") == name), None)
+        if timer is None:
+            return None
+
+        # Use job_id (normalize to timer_id for consistency)
+        timer_id = timer.get("job_id") or timer.get("timer_id")
+        result = unwrap_response(api.timers_client.get_job(timer_id))
+
+        # Normalize job_id to timer_id for consistent interface
+        if "job_id" in result and "timer_id" not in result:
+            result["timer_id"] = result["job_id"]
+
+        return result
     except Exception as e:
         api.handle_api_error(e, f"searching for timer '{name}'")
 
@@ -224,22 +244,12 @@ def parse_schedule(schedule_params, start=None, stop_after=None, stop_after_n=No
             schedule["datetime"] = schedule_params["datetime"]
         else:
             # Default to 1 hour from now
-            future_time = datetime.utcnow() + timedelta(hours=1)
-            schedule["datetime"] = future_time.isoformat() + "Z"
+            future_time = datetime.now(UTC) + _DEFAULT_FUTURE
+            schedule["datetime"] = future_time.isoformat().replace("+00:00", "Z")
 
     elif schedule_type == "recurring":
-        # Calculate interval in seconds
-        interval = 0
-        if "interval_seconds" in schedule_params:
-            interval = schedule_params["interval_seconds"]
-        elif "interval_minutes" in schedule_params:
-            interval = schedule_params["interval_minutes"] * 60
-        elif "interval_hours" in schedule_params:
-            interval = schedule_params["interval_hours"] * 3600
-        elif "interval_days" in schedule_params:
-            interval = schedule_params["interval_days"] * 86400
-
-        if interval == 0:
+        interval = _compute_interval(schedule_params)
+        if not interval:
             raise ValueError("Recurring timer must specify an interval")
 
         schedule["interval_seconds"] = interval
@@ -257,8 +267,7 @@ def parse_schedule(schedule_params, start=None, stop_after=None, stop_after_n=No
 def create_timer(api, params):
     """Create a new timer using SDK."""
     try:
-        from datetime import datetime
-
+        # Imported lazily: TimerJob is not available in every SDK version
         from globus_sdk import TimerJob
 
         # Parse schedule into start time and interval
@@ -277,17 +286,10 @@ def create_timer(api, params):
         # Determine interval (None for one-time timers)
         interval = None
         if schedule_type == "recurring":
-            if "interval_seconds" in schedule_params:
-                interval = schedule_params["interval_seconds"]
-            elif "interval_minutes" in schedule_params:
-                interval = schedule_params["interval_minutes"] * 60
-            elif "interval_hours" in schedule_params:
-                interval = schedule_params["interval_hours"] * 3600
-            elif "interval_days" in schedule_params:
-                interval = schedule_params["interval_days"] * 86400
-            else:
+            interval = _compute_interval(schedule_params)
+            if interval is None:
                 # Default to 24 hours if no interval specified
-                interval = 86400
+                interval = _INTERVAL_MULTIPLIERS["interval_days"]
 
         # Build timer job using SDK's TimerJob class
         job_kwargs = {
@@ -308,7 +310,7 @@ def create_timer(api, params):
 
         timer_job = TimerJob(**job_kwargs)
         response = api.timers_client.create_job(data=timer_job)
-        result = response.data if hasattr(response, "data") else response
+        result = unwrap_response(response)
 
         # Normalize job_id to timer_id for consistent interface
         if "job_id" in result and "timer_id" not in result:
@@ -344,7 +346,7 @@ def update_timer(api, timer_id, params):
 
         if update_data:
             response = api.timers_client.update_timer(timer_id, timer=update_data)
-            return response.data if hasattr(response, "data") else response
+            return unwrap_response(response)
 
         return None
     except Exception as e:
@@ -356,7 +358,7 @@ def pause_timer(api, timer_id):
     try:
         # Pause by updating the job to inactive state
         response = api.timers_client.update_job(timer_id, data={"inactive": True})
-        return response.data if hasattr(response, "data") else response
+        return unwrap_response(response)
     except Exception as e:
         api.handle_api_error(e, f"pausing timer {timer_id}")
 
@@ -365,7 +367,7 @@ def resume_timer(api, timer_id):
     """Resume/activate a timer using SDK."""
     try:
         response = api.timers_client.update_job(timer_id, data={"inactive": False})
-        return response.data if hasattr(response, "data") else response
+        return unwrap_response(response)
     except Exception as e:
         api.handle_api_error(e, f"resuming timer {timer_id}")
 
@@ -413,7 +415,7 @@ def main():
     if timer_id:
         try:
             response = api.timers_client.get_timer(timer_id)
-            existing_timer = response.data if hasattr(response, "data") else response
+            existing_timer = unwrap_response(response)
         except Exception:
             existing_timer = None
     else:
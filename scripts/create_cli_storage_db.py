@@ -18,123 +18,209 @@ Environment Variables Required:
 Optional:
     GLOBUS_SDK_ENVIRONMENT: Target environment (default: test)
     GLOBUS_CLI_STORAGE_PATH: Override storage.db path (default: ~/.globus/cli/storage.db)
+    XDG_CACHE_HOME: Base directory for the cached S3 object (default: ~/.cache)
 """
 
+import functools
+import hashlib
 import json
 import os
 import sqlite3
 import sys
 from pathlib import Path
 
-# Add tests directory to path for s3_token_storage import
-tests_path = Path(__file__).parent.parent / "tests"
-sys.path.insert(0, str(tests_path))
-
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError:
     print("ERROR: boto3 not installed: pip install boto3")
     sys.exit(1)
 
+# orjson is optional; fall back to the stdlib json module when it is absent
+try:
+    import orjson
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# Local cache for the S3 token object, revalidated with its ETag
+TOKEN_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "ansible-globus"
+)
+
+INSERT_TOKEN_SQL = (
+    "INSERT INTO token_storage (namespace, resource_server, token_data_json) "
+    "VALUES (?, ?, ?)"
+)
+
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=20,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+
+@functools.cache
+def _get_s3_client(region: str | None):
+    """Get a shared S3 client for the given region."""
+    return boto3.client("s3", region_name=region, config=S3_CLIENT_CONFIG)
+
+
+def _cache_paths(bucket: str, key: str) -> tuple[Path, Path]:
+    """Get the local cache paths (body, etag) for an S3 object."""
+    digest = hashlib.sha256(f"{bucket}/{key}".encode()).hexdigest()[:16]
+    return (
+        TOKEN_CACHE_DIR / f"tokens-{digest}.json",
+        TOKEN_CACHE_DIR / f"tokens-{digest}.etag",
+    )
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Atomically write data to a file readable only by the owner."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 
 def get_tokens_from_s3(
     bucket: str, key: str, namespace: str, region: str | None
 ) -> dict:
-    """Download tokens from S3."""
-    s3 = boto3.client("s3", region_name=region)
+    """Download tokens from S3.
 
-    try:
-        response = s3.get_object(Bucket=bucket, Key=key)
-        content = response["Body"].read().decode("utf-8")
-        all_data = json.loads(content)
+    The object body and its ETag are cached locally, and later runs send a
+    conditional GET so an unchanged object is not transferred again.
+    """
+    s3 = _get_s3_client(region)
+    body_path, etag_path = _cache_paths(bucket, key)
 
-        if namespace not in all_data:
-            print(f"ERROR: Namespace '{namespace}' not found in S3 tokens")
-            print(f"Available namespaces: {list(all_data.keys())}")
-            sys.exit(1)
+    get_kwargs = {"Bucket": bucket, "Key": key}
+    if body_path.exists() and etag_path.exists():
+        get_kwargs["IfNoneMatch"] = etag_path.read_text()
 
-        return all_data[namespace]
+    try:
+        response = s3.get_object(**get_kwargs)
+        body = response["Body"].read()
+        # Write the body before the ETag so the ETag never outlives its body
+        _write_private(body_path, body)
+        _write_private(etag_path, response["ETag"].encode())
 
     except ClientError as e:
-        if e.response["Error"]["Code"] == "NoSuchKey":
-            print(f"ERROR: Token file not found: s3://{bucket}/{key}")
+        code = e.response["Error"]["Code"]
+        if code in ("304", "NotModified"):
+            body = body_path.read_bytes()
         else:
-            print(f"ERROR: Failed to download from S3: {e}")
+            if code == "NoSuchKey":
+                print(f"ERROR: Token file not found: s3://{bucket}/{key}")
+            else:
+                print(f"ERROR: Failed to download from S3: {e}")
+            sys.exit(1)
+
+    all_data = json_loads(body)
+
+    if namespace not in all_data:
+        print(f"ERROR: Namespace '{namespace}' not found in S3 tokens")
+        print(f"Available namespaces: {list(all_data.keys())}")
         sys.exit(1)
 
+    return all_data[namespace]
+
 
-def create_storage_db(db_path: str, tokens: dict, environment: str) -> None:
-    """Create a globus-cli compatible storage.db file."""
+def create_storage_db(
+    db_path: str, tokens: dict, environment: str
+) -> list[tuple[str, str]]:
+    """Create a globus-cli compatible storage.db file.
+
+    Returns the (namespace, resource_server) pairs read back from the new
+    database, using the same connection that wrote them.
+    """
     # Ensure parent directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
     # Remove existing database if present
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    Path(db_path).unlink(missing_ok=True)
+
+    # Pre-create the file owner read/write only (matching the CLI's default)
+    # so the tokens are never readable by others, even briefly
+    os.close(os.open(db_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
 
     conn = sqlite3.connect(db_path)
+    # The file is rebuilt from S3 on every run, so skip the on-disk rollback
+    # journal and the extra fsyncs while populating it. journal_mode=MEMORY is
+    # per-connection, unlike WAL, so globus-cli still sees a default database.
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
     cursor = conn.cursor()
 
     # Create tables matching globus-cli schema
-    cursor.execute(
+    cursor.executescript(
         """
         CREATE TABLE config_storage (
             namespace VARCHAR NOT NULL,
             config_name VARCHAR NOT NULL,
             config_data_json VARCHAR NOT NULL,
             PRIMARY KEY (namespace, config_name)
-        )
-    """
-    )
+        );
 
-    cursor.execute(
-        """
         CREATE TABLE token_storage (
             namespace VARCHAR NOT NULL,
             resource_server VARCHAR NOT NULL,
             token_data_json VARCHAR NOT NULL,
             PRIMARY KEY (namespace, resource_server)
-        )
-    """
-    )
+        );
 
-    cursor.execute(
-        """
         CREATE TABLE sdk_storage_adapter_internal (
             attribute VARCHAR NOT NULL,
             value VARCHAR NOT NULL,
             PRIMARY KEY (attribute)
-        )
+        );
     """
     )
 
     # Build namespace for CLI format: userprofile/{environment}
     cli_namespace = f"userprofile/{environment}"
 
-    # Insert tokens
-    for resource_server, token_data in tokens.items():
-        # Convert S3 token format to CLI format
-        # S3 has extra fields like 'stored_at' and 'client_id' that CLI doesn't need
-        cli_token_data = {
-            "access_token": token_data["access_token"],
-            "refresh_token": token_data.get("refresh_token"),
-            "expires_at_seconds": token_data.get("expires_at_seconds"),
-            "resource_server": resource_server,
-            "scope": token_data.get("scope"),
-            "token_type": token_data.get("token_type", "Bearer"),
-        }
-
-        cursor.execute(
-            "INSERT INTO token_storage (namespace, resource_server, token_data_json) VALUES (?, ?, ?)",
-            (cli_namespace, resource_server, json.dumps(cli_token_data)),
+    # Convert S3 token format to CLI format
+    # S3 has extra fields like 'stored_at' and 'client_id' that CLI doesn't need.
+    # Rows are generated lazily and consumed directly by executemany.
+    rows = (
+        (
+            cli_namespace,
+            resource_server,
+            json_dumps(
+                {
+                    "access_token": token_data["access_token"],
+                    "refresh_token": token_data.get("refresh_token"),
+                    "expires_at_seconds": token_data.get("expires_at_seconds"),
+                    "resource_server": resource_server,
+                    "scope": token_data.get("scope"),
+                    "token_type": token_data.get("token_type", "Bearer"),
+                }
+            ),
         )
+        for resource_server, token_data in tokens.items()
+    )
 
+    # Insert all tokens in a single transaction
+    conn.execute("BEGIN")
+    cursor.executemany(INSERT_TOKEN_SQL, rows)
     conn.commit()
+
+    # Read back what was written for verification
+    cursor.execute("SELECT namespace, resource_server FROM token_storage")
+    stored = cursor.fetchall()
     conn.close()
 
-    # Set permissions to match CLI's default (owner read/write only)
-    os.chmod(db_path, 0o600)
+    return stored
 
 
 def main():
@@ -157,14 +243,20 @@ def main():
         print("ERROR: S3_TOKEN_BUCKET environment variable not set")
         sys.exit(1)
 
-    print("Configuration:")
-    print(f"  S3 Bucket: {bucket}")
-    print(f"  S3 Key: {key}")
-    print(f"  S3 Namespace: {namespace}")
-    print(f"  AWS Region: {region}")
-    print(f"  Globus Environment: {environment}")
-    print(f"  Storage DB Path: {db_path}")
-    print()
+    print(
+        "\n".join(
+            [
+                "Configuration:",
+                f"  S3 Bucket: {bucket}",
+                f"  S3 Key: {key}",
+                f"  S3 Namespace: {namespace}",
+                f"  AWS Region: {region}",
+                f"  Globus Environment: {environment}",
+                f"  Storage DB Path: {db_path}",
+            ]
+        ),
+        end="\n\n",
+    )
 
     # Download tokens from S3
     print("Downloading tokens from S3...")
@@ -172,27 +264,24 @@ def main():
     print(f"OK: Found {len(tokens)} token(s)\n")
 
     # Display token info
-    print("Tokens:")
-    for rs in tokens:
-        print(f"  - {rs}")
-    print()
+    print("\n".join(["Tokens:", *(f"  - {rs}" for rs in tokens)]), end="\n\n")
 
     # Create storage.db
     print(f"Creating storage.db at {db_path}...")
-    create_storage_db(db_path, tokens, environment)
+    rows = create_storage_db(db_path, tokens, environment)
     print("OK: storage.db created successfully!\n")
 
     # Verify
     print("Verifying storage.db...")
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT namespace, resource_server FROM token_storage")
-    rows = cursor.fetchall()
-    conn.close()
 
-    print(f"OK: Found {len(rows)} token entries:")
-    for ns, rs in rows:
-        print(f"  - {ns} -> {rs}")
+    print(
+        "\n".join(
+            [
+                f"OK: Found {len(rows)} token entries:",
+                *(f"  - {ns} -> {rs}" for ns, rs in rows),
+            ]
+        )
+    )
 
     print("\nStorage.db is ready for CLI auth!")
     print(
@@ -17,43 +17,51 @@ import subprocess  # nosec B404 - Internal release automation script
 import sys
 from pathlib import Path
 
+# Matches the version line in galaxy.yml; group 1 is the key prefix, group 2 the value
+VERSION_RE = re.compile(r'^(version:\s*)["\']?([0-9.]+)["\']?', re.MULTILINE)
+
+# Classifies a conventional commit subject by its prefix; the named group that
+# matches is the stats category
+COMMIT_TYPE_RE = re.compile(
+    r"^(?:(?P<breaking>feat!:|fix!:)|(?P<feat>feat)|(?P<fix>fix))"
+)
+
 
 def run_command(cmd, check=True, capture=True):
-    """Run a shell command and return output."""
-    result = subprocess.run(  # nosec B602 - Internal release automation
+    """Run a command (argv list, no shell) and return output."""
+    result = subprocess.run(  # nosec B603 - Internal release automation
         cmd,
-        shell=True,  # Needed for git commands
         capture_output=capture,
         text=True,
         check=False,
     )
     if check and result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
+        print(f"❌ Command failed: {' '.join(cmd)}")
         if result.stderr:
             print(result.stderr)
         sys.exit(1)
     return result
 
 
-def get_current_version():
-    """Read current version from galaxy.yml."""
+def read_galaxy_yml():
+    """Read galaxy.yml and return its content and current version."""
     galaxy_yml = Path("galaxy.yml")
     if not galaxy_yml.exists():
         print("❌ galaxy.yml not found")
         sys.exit(1)
 
     content = galaxy_yml.read_text()
-    match = re.search(r'^version:\s*["\']?([0-9.]+)["\']?', content, re.MULTILINE)
+    match = VERSION_RE.search(content)
     if not match:
         print("❌ Could not find version in galaxy.yml")
         sys.exit(1)
 
-    return match.group(1)
+    return content, match.group(2)
 
 
 def get_last_tag():
     """Get the most recent git tag."""
-    result = run_command("git describe --tags --abbrev=0 2>/dev/null", check=False)
+    result = run_command(["git", "describe", "--tags", "--abbrev=0"], check=False)
     if result.returncode != 0:
         return None
     return result.stdout.strip()
@@ -61,33 +69,28 @@ def get_last_tag():
 
 def analyze_commits(since_ref):
     """Analyze conventional commits since a ref."""
+    cmd = ["git", "log", "--pretty=format:%s"]
     if since_ref:
-        cmd = f"git log {since_ref}..HEAD --pretty=format:%s"
-    else:
-        cmd = "git log --pretty=format:%s"
+        cmd.append(f"{since_ref}..HEAD")
 
-    result = run_command(cmd, check=False)
-    if result.returncode != 0:
-        return {"feat": 0, "fix": 0, "breaking": 0, "other": 0}
-
-    commits = result.stdout.strip().split("\n")
     stats = {"feat": 0, "fix": 0, "breaking": 0, "other": 0}
 
-    for commit in commits:
-        if not commit:
-            continue
-        if (
-            "BREAKING CHANGE" in commit
-            or commit.startswith("feat!:")
-            or commit.startswith("fix!:")
-        ):
-            stats["breaking"] += 1
-        elif commit.startswith("feat"):
-            stats["feat"] += 1
-        elif commit.startswith("fix"):
-            stats["fix"] += 1
-        else:
-            stats["other"] += 1
+    # Stream subjects line by line rather than buffering the whole log
+    with subprocess.Popen(  # nosec B603 - Internal release automation
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    ) as proc:
+        for line in proc.stdout:
+            commit = line.rstrip("\n")
+            if not commit:
+                continue
+            if "BREAKING CHANGE" in commit:
+                stats["breaking"] += 1
+                continue
+            match = COMMIT_TYPE_RE.match(commit)
+            stats[match.lastgroup if match else "other"] += 1
+
+    if proc.returncode != 0:
+        return {"feat": 0, "fix": 0, "breaking": 0, "other": 0}
 
     return stats
 
@@ -121,32 +124,23 @@ def bump_version(current, bump_type):
         sys.exit(1)
 
 
-def update_galaxy_yml(new_version):
-    """Update version in galaxy.yml."""
-    galaxy_yml = Path("galaxy.yml")
-    content = galaxy_yml.read_text()
-
-    updated = re.sub(
-        r'^(version:\s*)["\']?[0-9.]+["\']?',
-        rf"\g<1>{new_version}",
-        content,
-        flags=re.MULTILINE,
-    )
-
-    galaxy_yml.write_text(updated)
+def update_galaxy_yml(content, new_version):
+    """Write galaxy.yml content back with the version replaced."""
+    updated = VERSION_RE.sub(rf"\g<1>{new_version}", content, count=1)
+    Path("galaxy.yml").write_text(updated, newline="")
 
 
 def update_changelog(new_version):
     """Update CHANGELOG.md using git-cliff."""
     # Check if git-cliff is installed
-    result = run_command("which git-cliff", check=False)
+    result = run_command(["which", "git-cliff"], check=False)
     if result.returncode != 0:
         print("❌ git-cliff not found. Install with: brew install git-cliff")
         sys.exit(1)
 
     # Generate changelog
     print(f"📝 Generating changelog for v{new_version}...")
-    cmd = f"git-cliff --tag v{new_version} --output CHANGELOG.md"
+    cmd = ["git-cliff", "--tag", f"v{new_version}", "--output", "CHANGELOG.md"]
     result = run_command(cmd, check=True)
 
 
@@ -162,7 +156,7 @@ def main():
     print("📦 Preparing release...\n")
 
     # Get current version
-    current = get_current_version()
+    galaxy_content, current = read_galaxy_yml()
     print(f"Current version: {current}")
 
     # Get last tag
@@ -219,7 +213,7 @@ def main():
     update_changelog(new_version)
     print("✓ Updated CHANGELOG.md")
 
-    update_galaxy_yml(new_version)
+    update_galaxy_yml(galaxy_content, new_version)
     print(f"✓ Updated galaxy.yml ({current} → {new_version})")
 
     # Print next steps
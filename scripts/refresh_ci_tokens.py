@@ -23,11 +23,13 @@ Optional:
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add tests directory to path for s3_token_storage import
-tests_path = Path(__file__).parent.parent / "tests"
-sys.path.insert(0, str(tests_path))
+tests_path = str(Path(__file__).resolve().parent.parent / "tests")
+if tests_path not in sys.path:
+    sys.path.insert(0, tests_path)
 
 try:
     from s3_token_storage import S3TokenStorage
@@ -42,6 +44,9 @@ except ImportError:
     print("ERROR: globus-sdk not installed: pip install globus-sdk")
     sys.exit(1)
 
+# Upper bound on concurrent refresh requests to Globus Auth
+REFRESH_MAX_WORKERS = 8
+
 
 def main():
     """Refresh tokens in S3 if they're expired or expiring soon."""
@@ -63,13 +68,19 @@ def main():
         print("ERROR: GLOBUS_CLIENT_ID environment variable not set")
         sys.exit(1)
 
-    print("Configuration:")
-    print(f"  Bucket: {bucket}")
-    print(f"  Key: {key}")
-    print(f"  Namespace: {namespace}")
-    print(f"  Region: {region}")
-    print(f"  Client ID: {client_id[:20]}...")
-    print()
+    print(
+        "\n".join(
+            [
+                "Configuration:",
+                f"  Bucket: {bucket}",
+                f"  Key: {key}",
+                f"  Namespace: {namespace}",
+                f"  Region: {region}",
+                f"  Client ID: {client_id[:20]}...",
+            ]
+        ),
+        end="\n\n",
+    )
 
     # Load tokens from S3
     try:
@@ -120,11 +131,12 @@ def main():
         )
         sys.exit(1)
 
-    # Check each token and refresh if needed
+    # Check each token and collect the ones that need a refresh
     auth_client = NativeAppAuthClient(native_client_id)
     current_time = time.time()
     refreshed_count = 0
     needs_save = False
+    to_refresh = []
 
     for resource_server, token_data in tokens.items():
         expires_at = token_data.get("expires_at_seconds", 0)
@@ -144,48 +156,62 @@ def main():
                 print("    Run: python scripts/setup_oauth_tokens.py")
                 sys.exit(1)
 
-            # Refresh the token
-            print(f"    Refreshing (expires in {time_until_expiry:.0f}s)...")
-            try:
-                token_response = auth_client.oauth2_refresh_token(refresh_token)
-
-                # Update the token data
-                refreshed_data = token_response.by_resource_server.get(resource_server)
-                if refreshed_data:
-                    tokens[resource_server].update(
-                        {
-                            "access_token": refreshed_data["access_token"],
-                            "expires_at_seconds": refreshed_data["expires_at_seconds"],
-                            "refresh_token": refreshed_data.get(
-                                "refresh_token", refresh_token
-                            ),
-                        }
-                    )
-                    new_expiry = refreshed_data["expires_at_seconds"] - current_time
-                    print(
-                        f"    OK: Refreshed! New expiry: {new_expiry / 3600:.1f} hours"
-                    )
-                    refreshed_count += 1
-                    needs_save = True
-                else:
-                    print(
-                        f"    WARN: No data for {resource_server} in refresh response"
-                    )
-
-            except Exception as e:
-                print(f"    ERROR: Refresh failed: {e}")
-                sys.exit(1)
+            print(f"    Needs refresh (expires in {time_until_expiry:.0f}s)")
+            to_refresh.append((resource_server, refresh_token))
         else:
             print("    OK: Still valid")
 
         print()
 
+    # Refresh expiring tokens concurrently; each refresh is an independent
+    # round trip to Globus Auth, and the auth client is shared across threads
+    if to_refresh:
+        print(f"Refreshing {len(to_refresh)} token(s)...")
+        try:
+            with ThreadPoolExecutor(max_workers=REFRESH_MAX_WORKERS) as executor:
+                responses = list(
+                    executor.map(
+                        lambda item: auth_client.oauth2_refresh_token(item[1]),
+                        to_refresh,
+                    )
+                )
+        except Exception as e:
+            print(f"  ERROR: Refresh failed: {e}")
+            sys.exit(1)
+
+        for (resource_server, refresh_token), token_response in zip(
+            to_refresh, responses, strict=True
+        ):
+            # Update the token data
+            refreshed_data = token_response.by_resource_server.get(resource_server)
+            if refreshed_data:
+                tokens[resource_server].update(
+                    {
+                        "access_token": refreshed_data["access_token"],
+                        "expires_at_seconds": refreshed_data["expires_at_seconds"],
+                        "refresh_token": refreshed_data.get(
+                            "refresh_token", refresh_token
+                        ),
+                    }
+                )
+                new_expiry = refreshed_data["expires_at_seconds"] - current_time
+                print(
+                    f"  OK: {resource_server} refreshed! "
+                    f"New expiry: {new_expiry / 3600:.1f} hours"
+                )
+                refreshed_count += 1
+                needs_save = True
+            else:
+                print(f"  WARN: No data for {resource_server} in refresh response")
+
+        print()
+
     # Save refreshed tokens back to S3
     if needs_save:
         print(f"Saving {refreshed_count} refreshed token(s) back to S3...")
         try:
-            # Reconstruct the full data structure
-            all_data = storage._load_from_s3()  # noqa: SLF001
+            # Reconstruct the full data structure, reusing the initial S3 read
+            all_data = storage.load_all_data()
             all_data[namespace] = tokens
             storage._save_to_s3(all_data)  # noqa: SLF001
             print("OK: Tokens saved to S3")
@@ -19,18 +19,19 @@ import subprocess  # nosec B404 - Internal release automation script
 import sys
 from pathlib import Path
 
+VERSION_RE = re.compile(r'^version:\s*["\']?([0-9.]+)["\']?', re.MULTILINE)
+
 
 def run_command(cmd, check=True, capture=True):
-    """Run a shell command and return output."""
-    result = subprocess.run(  # nosec B602 - Internal release automation
+    """Run a command (argv list, no shell) and return output."""
+    result = subprocess.run(  # nosec B603 - Internal release automation
         cmd,
-        shell=True,  # Needed for git commands
         capture_output=capture,
         text=True,
         check=False,
     )
     if check and result.returncode != 0:
-        print(f"❌ Command failed: {cmd}")
+        print(f"❌ Command failed: {' '.join(cmd)}")
         if result.stderr:
             print(result.stderr)
         sys.exit(1)
@@ -45,7 +46,7 @@ def get_version_from_galaxy():
         sys.exit(1)
 
     content = galaxy_yml.read_text()
-    match = re.search(r'^version:\s*["\']?([0-9.]+)["\']?', content, re.MULTILINE)
+    match = VERSION_RE.search(content)
     if not match:
         print("❌ Could not find version in galaxy.yml")
         sys.exit(1)
@@ -73,7 +74,7 @@ def check_changelog_updated(version):
 
 def check_git_status():
     """Check that CHANGELOG.md and galaxy.yml are modified."""
-    result = run_command("git status --porcelain", check=True)
+    result = run_command(["git", "status", "--porcelain"], check=True)
     status = result.stdout.strip()
 
     if not status:
@@ -99,7 +100,7 @@ def check_git_status():
 
 def check_branch():
     """Ensure we're on main branch."""
-    result = run_command("git branch --show-current", check=True)
+    result = run_command(["git", "branch", "--show-current"], check=True)
     branch = result.stdout.strip()
 
     if branch != "main":
@@ -113,7 +114,7 @@ def check_branch():
 def run_galaxy_test():
     """Run galaxy build test."""
     print("\n🧪 Testing Galaxy build...")
-    result = run_command("tox -e galaxy-test", check=False, capture=False)
+    result = run_command(["tox", "-e", "galaxy-test"], check=False, capture=False)
 
     if result.returncode != 0:
         print("\n❌ Galaxy build test failed")
@@ -176,26 +177,30 @@ def main():
 
     # Git operations
     print("\n📝 Committing changes...")
-    run_command("git add CHANGELOG.md galaxy.yml", check=True, capture=False)
+    run_command(["git", "add", "CHANGELOG.md", "galaxy.yml"], check=True, capture=False)
 
     commit_msg = f"chore(release): prepare for {version}"
-    run_command(f'git commit -m "{commit_msg}"', check=True, capture=False)
+    run_command(["git", "commit", "-m", commit_msg], check=True, capture=False)
     print(f"✓ Committed: {commit_msg}")
 
     print(f"\n🏷️  Creating tag v{version}...")
     run_command(
-        f'git tag -a v{version} -m "Release v{version}"', check=True, capture=False
+        ["git", "tag", "-a", f"v{version}", "-m", f"Release v{version}"],
+        check=True,
+        capture=False,
     )
     print(f"✓ Tagged: v{version}")
 
     print("\n⬆️  Pushing to GitHub...")
-    result = run_command("git push origin main", check=False, capture=False)
+    result = run_command(["git", "push", "origin", "main"], check=False, capture=False)
     if result.returncode != 0:
         print("❌ Failed to push to main")
         print("   You may need to manually push and tag")
         sys.exit(1)
 
-    result = run_command(f"git push origin v{version}", check=False, capture=False)
+    result = run_command(
+        ["git", "push", "origin", f"v{version}"], check=False, capture=False
+    )
     if result.returncode != 0:
         print("❌ Failed to push tag")
         print(f"   You may need to manually push tag: git push origin v{version}")
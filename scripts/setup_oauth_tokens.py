@@ -42,6 +42,8 @@ Prerequisites:
 import argparse
 import os
 import sys
+import threading
+import time
 import webbrowser
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from urllib.parse import parse_qs, urlparse
@@ -56,10 +58,6 @@ from globus_sdk.scopes import (
     TransferScopes,
 )
 
-# Add tests directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
-from s3_token_storage import S3TokenStorage  # noqa: E402
-
 # Required scopes for all Ansible modules (works across all environments)
 REQUIRED_SCOPES = [
     TransferScopes.all,
@@ -70,8 +68,45 @@ REQUIRED_SCOPES = [
     AuthScopes.manage_projects,
 ]
 
-# OAuth redirect handling
-auth_code_received = None
+# Seconds to wait for the OAuth callback before giving up
+OAUTH_CALLBACK_TIMEOUT = 300
+
+
+# Pages shown in the browser after the OAuth redirect
+SUCCESS_HTML = b"""
+<html>
+<head><title>Globus Authentication Successful</title></head>
+<body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
+    <h1 style="color: green;">Authentication Successful!</h1>
+    <p>Your Globus tokens have been received.</p>
+    <p>You can close this window and return to the terminal.</p>
+</body>
+</html>
+"""
+
+ERROR_HTML = b"""
+<html>
+<head><title>Authentication Failed</title></head>
+<body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
+    <h1 style="color: red;">Authentication Failed</h1>
+    <p>No authorization code received.</p>
+    <p>Please try again.</p>
+</body>
+</html>
+"""
+
+
+class OAuthCallbackServer(HTTPServer):
+    """HTTP server that records the result of the OAuth callback."""
+
+    # Allow an immediate rerun while the previous socket is in TIME_WAIT
+    allow_reuse_address = True
+
+    def __init__(self, server_address: tuple) -> None:
+        super().__init__(server_address, OAuthCallbackHandler)
+        self.auth_code = None
+        self.auth_error = None
+        self.callback_received = threading.Event()
 
 
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
@@ -79,49 +114,31 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
     def do_GET(self) -> None:
         """Handle GET request with OAuth code."""
-        global auth_code_received
-
         # Parse the authorization code from URL
         query = urlparse(self.path).query
         params = parse_qs(query)
 
         if "code" in params:
-            auth_code_received = params["code"][0]
-
-            # Send success response
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-
-            success_html = """
-            <html>
-            <head><title>Globus Authentication Successful</title></head>
-            <body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: green;">Authentication Successful!</h1>
-                <p>Your Globus tokens have been received.</p>
-                <p>You can close this window and return to the terminal.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(success_html.encode())
-        else:
+            self.server.auth_code = params["code"][0]
+            self.server.callback_received.set()
+            self._send_html(200, SUCCESS_HTML)
+        elif "error" in params:
             # Handle error
-            auth_code_received = None
-            self.send_response(400)
-            self.send_header("Content-type", "text/html")
+            self.server.auth_error = params["error"][0]
+            self.server.callback_received.set()
+            self._send_html(400, ERROR_HTML)
+        else:
+            # Browser probes such as /favicon.ico are not the callback
+            self.send_response(204)
             self.end_headers()
 
-            error_html = """
-            <html>
-            <head><title>Authentication Failed</title></head>
-            <body style="font-family: Arial, sans-serif; text-align: center; padding: 50px;">
-                <h1 style="color: red;">Authentication Failed</h1>
-                <p>No authorization code received.</p>
-                <p>Please try again.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(error_html.encode())
+    def _send_html(self, status: int, body: bytes) -> None:
+        """Send a complete HTML response with an explicit Content-Length."""
+        self.send_response(status)
+        self.send_header("Content-type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
     def log_message(self, format: str, *args) -> None:
         """Suppress HTTP server logs."""
@@ -139,8 +156,6 @@ def perform_oauth_flow(client_id: str, environment: str = None) -> dict:
     Returns:
         Token response dict with access and refresh tokens
     """
-    global auth_code_received
-
     # Create auth client
     client = NativeAppAuthClient(client_id, environment=environment)
 
@@ -173,13 +188,22 @@ def perform_oauth_flow(client_id: str, environment: str = None) -> dict:
 
     # Start HTTP server to receive callback
     print("Waiting for OAuth callback...")
-    server = HTTPServer(("localhost", redirect_port), OAuthCallbackHandler)
+    # Bind IPv4 loopback explicitly rather than whatever "localhost" resolves to
+    server = OAuthCallbackServer(("127.0.0.1", redirect_port))
+    server.timeout = 1
 
-    # Wait for one request (the OAuth callback)
-    server.handle_request()
+    # Serve requests until the OAuth callback arrives, ignoring browser probes
+    deadline = time.monotonic() + OAUTH_CALLBACK_TIMEOUT
+    with server:
+        while not server.callback_received.is_set() and time.monotonic() < deadline:
+            server.handle_request()
 
+    auth_code_received = server.auth_code
     if not auth_code_received:
-        print("\nERROR: No authorization code received")
+        if server.auth_error:
+            print(f"\nERROR: Authorization failed: {server.auth_error}")
+        else:
+            print("\nERROR: No authorization code received")
         sys.exit(1)
 
     print("OK: Authorization code received")
@@ -236,6 +260,10 @@ def store_tokens_in_s3(
         print(f"KMS Key: {kms_key_id}")
     print("=" * 60)
 
+    # Imported here so the OAuth flow and --help do not pay for boto3
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tests"))
+    from s3_token_storage import S3TokenStorage
+
     storage = S3TokenStorage(
         bucket=bucket,
         key=key,
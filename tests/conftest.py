@@ -5,8 +5,18 @@ This module provides fixtures for authentication and token management
 across unit, integration, and E2E tests.
 """
 
+import contextlib
+import fcntl
+import functools
+import hashlib
+import json
+import logging
 import os
+import shutil
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import pytest
@@ -17,6 +27,103 @@ tests_path = Path(__file__).parent
 sys.path.insert(0, str(plugins_path))
 sys.path.insert(0, str(tests_path))
 
+logger = logging.getLogger("ansible_globus.tests")
+
+# Local cache for tokens fetched from S3, shared across pytest invocations
+TOKEN_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "ansible-globus"
+)
+
+# Tokens expiring within this many seconds are refreshed rather than reused
+TOKEN_EXPIRY_MARGIN = 300
+
+# Map service names to resource servers
+SERVICE_TO_RESOURCE_SERVER = {
+    "groups": "groups.api.globus.org",
+    "transfer": "transfer.api.globus.org",
+    "flows": "flows.globus.org",
+    "compute": "funcx_service",
+    "timers": "524230d7-ea86-4a52-8312-86065a9e0417",  # Timers have their own resource server
+    "auth": "auth.globus.org",  # Auth/Projects use auth resource server
+    "search": "search.api.globus.org",  # Search index management
+}
+
+# Scopes requested for all services we test via client credentials
+# Note: Flows/Timers use resource server UUID-based scope format
+# Compute is excluded as it uses different scope format in test environment
+# and compute tests run on GCS hosts with their own auth
+CLIENT_CREDENTIALS_SCOPES = [
+    "urn:globus:auth:scope:transfer.api.globus.org:all",
+    "urn:globus:auth:scope:groups.api.globus.org:all",
+    # Flows scopes (eec9b274-0c81-4334-bdc2-54e90e689b9a is the flows resource server)
+    "https://auth.globus.org/scopes/eec9b274-0c81-4334-bdc2-54e90e689b9a/manage_flows",
+    "https://auth.globus.org/scopes/eec9b274-0c81-4334-bdc2-54e90e689b9a/run",
+    # Timers scope (524230d7-ea86-4a52-8312-86065a9e0417 is the timers resource server)
+    "https://auth.globus.org/scopes/524230d7-ea86-4a52-8312-86065a9e0417/timer",
+    # Search scope
+    "urn:globus:auth:scope:search.api.globus.org:all",
+]
+
+
+class _CachedTokenStore:
+    """
+    Local file cache for one set of tokens.
+
+    Lets repeated pytest runs reuse still-valid tokens without contacting S3
+    or Globus Auth. The cache file is written atomically and readable only by
+    the owner.
+    """
+
+    def __init__(self, prefix, cache_id):
+        digest = hashlib.sha1(cache_id.encode()).hexdigest()[:16]
+        self.path = TOKEN_CACHE_DIR / f"{prefix}-{digest}.json"
+
+    @contextlib.contextmanager
+    def locked(self):
+        """Hold an exclusive lock so concurrent workers fetch tokens only once."""
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(self.path.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def load(self):
+        """Return cached tokens if every one is still valid, else None."""
+        try:
+            tokens = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        deadline = time.time() + TOKEN_EXPIRY_MARGIN
+        if not tokens or any(
+            (token_data.get("expires_at_seconds") or 0) < deadline
+            for token_data in tokens.values()
+        ):
+            return None
+        return tokens
+
+    def save(self, tokens):
+        """Write tokens to the cache file."""
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates a uniquely named 0600 file, so concurrent writers
+        # never share a temp path
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+def pytest_configure(config):
+    """Enable debug logging for test fixtures when ANSIBLE_GLOBUS_DEBUG is set."""
+    if os.getenv("ANSIBLE_GLOBUS_DEBUG"):
+        logger.setLevel(logging.DEBUG)
+
 
 @pytest.fixture(scope="session")
 def globus_auth_config():
@@ -35,7 +142,7 @@ def globus_auth_config():
     """
     # Check for S3 token storage
     s3_bucket = os.getenv("S3_TOKEN_BUCKET")
-    print(f"DEBUG: S3_TOKEN_BUCKET = {s3_bucket}")
+    logger.debug("S3_TOKEN_BUCKET = %s", s3_bucket)
     if s3_bucket:
         config = {
             "method": "s3_tokens",
@@ -44,24 +151,24 @@ def globus_auth_config():
             "namespace": os.getenv("S3_TOKEN_NAMESPACE", "DEFAULT"),
             "region": os.getenv("AWS_REGION"),
         }
-        print(f"DEBUG: Using S3 tokens auth: {config}")
+        logger.debug("Using S3 tokens auth: %s", config)
         return config
 
     # Check for client credentials
     client_id = os.getenv("GLOBUS_CLIENT_ID")
     client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    print(f"DEBUG: GLOBUS_CLIENT_ID = {client_id is not None}")
+    logger.debug("GLOBUS_CLIENT_ID = %s", client_id is not None)
     if client_id and client_secret:
         config = {
             "method": "client_credentials",
             "client_id": client_id,
             "client_secret": client_secret,
         }
-        print("DEBUG: Using client credentials auth")
+        logger.debug("Using client credentials auth")
         return config
 
     # Fallback to CLI (local development)
-    print("DEBUG: Falling back to CLI auth")
+    logger.debug("Falling back to CLI auth")
     return {"method": "cli"}
 
 
@@ -79,25 +186,60 @@ def globus_tokens(globus_auth_config):
         Dict mapping resource_server to token_data
     """
     auth_method = globus_auth_config["method"]
-    print(f"DEBUG: globus_tokens using auth_method = {auth_method}")
+    logger.debug("globus_tokens using auth_method = %s", auth_method)
 
     if auth_method == "s3_tokens":
-        print("DEBUG: Calling _get_tokens_from_s3")
+        logger.debug("Calling _get_tokens_from_s3")
         return _get_tokens_from_s3(globus_auth_config)
     elif auth_method == "client_credentials":
-        print("DEBUG: Calling _get_tokens_from_client_credentials")
+        logger.debug("Calling _get_tokens_from_client_credentials")
         return _get_tokens_from_client_credentials(globus_auth_config)
     elif auth_method == "cli":
-        print("DEBUG: Calling _get_tokens_from_cli")
+        logger.debug("Calling _get_tokens_from_cli")
         return _get_tokens_from_cli()
     else:
         pytest.fail(f"Unknown auth method: {auth_method}")
 
 
+@functools.lru_cache(maxsize=4)
+def _native_auth_client(client_id):
+    """Return a NativeAppAuthClient shared by every refresh for client_id.
+
+    Reusing the client keeps its HTTP session, and so its connections, alive.
+    """
+    from globus_sdk import NativeAppAuthClient
+
+    return NativeAppAuthClient(client_id)
+
+
 def _get_tokens_from_s3(config):
-    """Retrieve tokens from S3 token storage and refresh if needed."""
-    import time
+    """Retrieve tokens from S3 token storage and refresh if needed.
 
+    Tokens are served from the local cache when all of them are still valid.
+    The cache is locked while fetching, so parallel pytest workers read S3
+    and refresh (possibly rotating) refresh tokens only once.
+    """
+    # JSON-encode the parts so distinct bucket/key/namespace combinations
+    # can never produce the same cache ID
+    cache_id = json.dumps([config["bucket"], config["key"], config["namespace"]])
+    cache = _CachedTokenStore("tokens", cache_id)
+    cached_tokens = cache.load()
+    if cached_tokens is not None:
+        return cached_tokens
+
+    with cache.locked():
+        # Another worker may have refreshed the tokens while we waited
+        cached_tokens = cache.load()
+        if cached_tokens is not None:
+            return cached_tokens
+
+        tokens = _fetch_tokens_from_s3(config)
+        cache.save(tokens)
+        return tokens
+
+
+def _fetch_tokens_from_s3(config):
+    """Load tokens from S3, refreshing expired ones and saving them back."""
     try:
         from s3_token_storage import S3TokenStorage
     except ImportError as e:
@@ -127,9 +269,6 @@ def _get_tokens_from_s3(config):
                 f"Run the token setup script to populate S3 with tokens."
             )
 
-        # Check if any tokens are expired and refresh them
-        from globus_sdk import NativeAppAuthClient
-
         # Get the native client ID from tokens (stored in metadata)
         # This is the Native App client ID used to create the tokens
         # (different from GLOBUS_CLIENT_ID which is the confidential app for GCS)
@@ -150,31 +289,48 @@ def _get_tokens_from_s3(config):
                 "This is required for token refresh."
             )
 
-        auth_client = NativeAppAuthClient(client_id)
-        needs_save = False
+        auth_client = _native_auth_client(client_id)
 
-        # Check each token and refresh if expired
-        for resource_server, token_data in tokens.items():
-            expires_at = token_data.get("expires_at_seconds", 0)
-            current_time = time.time()
-
-            # Refresh if token expires within next 5 minutes
-            if expires_at - current_time < 300:
-                refresh_token = token_data.get("refresh_token")
-                if not refresh_token:
-                    # Data problem - tokens are expired without refresh capability
-                    pytest.fail(
-                        f"Token for {resource_server} is expired (expires_at={expires_at}, "
-                        f"now={current_time}, diff={expires_at - current_time:.0f}s) "
-                        f"and no refresh token available.\n\n"
-                        f"This means tokens in S3 are stale and need to be refreshed.\n"
-                        f"Run: python scripts/refresh_ci_tokens.py\n"
-                        f"Or: python scripts/setup_oauth_tokens.py"
-                    )
+        # Collect tokens that expire within the next 5 minutes
+        current_time = time.time()
+        expired = [
+            (resource_server, token_data)
+            for resource_server, token_data in tokens.items()
+            if token_data.get("expires_at_seconds", 0) - current_time
+            < TOKEN_EXPIRY_MARGIN
+        ]
+        for resource_server, token_data in expired:
+            if not token_data.get("refresh_token"):
+                expires_at = token_data.get("expires_at_seconds", 0)
+                # Data problem - tokens are expired without refresh capability
+                pytest.fail(
+                    f"Token for {resource_server} is expired (expires_at={expires_at}, "
+                    f"now={current_time}, diff={expires_at - current_time:.0f}s) "
+                    f"and no refresh token available.\n\n"
+                    f"This means tokens in S3 are stale and need to be refreshed.\n"
+                    f"Run: python scripts/refresh_ci_tokens.py\n"
+                    f"Or: python scripts/setup_oauth_tokens.py"
+                )
 
-                # Refresh the token
-                try:
-                    token_response = auth_client.oauth2_refresh_token(refresh_token)
+        # Refresh expired tokens concurrently. Results are applied here on the
+        # calling thread, so the token dict needs no locking.
+        needs_save = False
+        failures = []
+        if expired:
+            with ThreadPoolExecutor(max_workers=len(expired)) as executor:
+                futures = {
+                    executor.submit(
+                        auth_client.oauth2_refresh_token, token_data["refresh_token"]
+                    ): resource_server
+                    for resource_server, token_data in expired
+                }
+                for future in as_completed(futures):
+                    resource_server = futures[future]
+                    try:
+                        token_response = future.result()
+                    except Exception as e:
+                        failures.append(f"{resource_server}: {e}")
+                        continue
 
                     # Update the token data
                     refreshed_data = token_response.by_resource_server.get(
@@ -188,23 +344,19 @@ def _get_tokens_from_s3(config):
                                     "expires_at_seconds"
                                 ),
                                 "refresh_token": refreshed_data.get(
-                                    "refresh_token", refresh_token
+                                    "refresh_token",
+                                    tokens[resource_server]["refresh_token"],
                                 ),
                             }
                         )
                         needs_save = True
 
-                except Exception as e:
-                    pytest.fail(f"Failed to refresh token for {resource_server}: {e}")
-
         # Save refreshed tokens back to S3
         if needs_save:
-            from globus_sdk import OAuthTokenResponse
+            storage.save_raw(tokens)
 
-            # Reconstruct token response for storage
-            token_dict = {"by_resource_server": tokens}
-            token_response = OAuthTokenResponse(token_dict)
-            storage.store(token_response)
+        if failures:
+            pytest.fail("Failed to refresh tokens:\n" + "\n".join(failures))
 
         return tokens
 
@@ -213,31 +365,34 @@ def _get_tokens_from_s3(config):
 
 
 def _get_tokens_from_client_credentials(config):
-    """Get tokens using client credentials flow."""
+    """Get tokens using client credentials flow.
+
+    Tokens are cached on disk per client and scope set, and the cache is locked
+    so parallel pytest workers share a single token request.
+    """
+    cache = _CachedTokenStore(
+        "cc", f"{config['client_id']}|{','.join(sorted(CLIENT_CREDENTIALS_SCOPES))}"
+    )
+    with cache.locked():
+        cached_tokens = cache.load()
+        if cached_tokens is not None:
+            return cached_tokens
+
+        tokens = _fetch_client_credentials_tokens(config)
+        cache.save(tokens)
+        return tokens
+
+
+def _fetch_client_credentials_tokens(config):
+    """Request tokens from Globus Auth with the client credentials grant."""
     from globus_sdk import ConfidentialAppAuthClient
 
     try:
         client = ConfidentialAppAuthClient(config["client_id"], config["client_secret"])
 
-        # Request scopes for all services we test
-        # Note: Flows/Timers use resource server UUID-based scope format
-        # Compute is excluded as it uses different scope format in test environment
-        # and compute tests run on GCS hosts with their own auth
-        all_scopes = [
-            "urn:globus:auth:scope:transfer.api.globus.org:all",
-            "urn:globus:auth:scope:groups.api.globus.org:all",
-            # Flows scopes (eec9b274-0c81-4334-bdc2-54e90e689b9a is the flows resource server)
-            "https://auth.globus.org/scopes/eec9b274-0c81-4334-bdc2-54e90e689b9a/manage_flows",
-            "https://auth.globus.org/scopes/eec9b274-0c81-4334-bdc2-54e90e689b9a/run",
-            # Timers scope (524230d7-ea86-4a52-8312-86065a9e0417 is the timers resource server)
-            "https://auth.globus.org/scopes/524230d7-ea86-4a52-8312-86065a9e0417/timer",
-            # Search scope
-            "urn:globus:auth:scope:search.api.globus.org:all",
-        ]
-
         try:
             token_response = client.oauth2_client_credentials_tokens(
-                requested_scopes=all_scopes
+                requested_scopes=CLIENT_CREDENTIALS_SCOPES
             )
         except Exception as e:
             # If client doesn't have all scopes, try with minimal scopes
@@ -271,19 +426,20 @@ def _get_tokens_from_client_credentials(config):
 
 def _get_tokens_from_cli():
     """Get tokens from Globus CLI."""
-    import json
     import subprocess
 
-    # Check if Globus CLI is available
-    try:
-        subprocess.run(["globus", "--version"], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if Globus CLI is available (a PATH lookup, no process spawn)
+    if shutil.which("globus") is None:
         pytest.skip("Globus CLI not available")
 
     # Check if authenticated
     try:
         result = subprocess.run(
-            ["globus", "session", "show"], check=True, capture_output=True, text=True
+            ["globus", "session", "show"],
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=5,
         )
         json.loads(result.stdout)
 
@@ -293,6 +449,8 @@ def _get_tokens_from_cli():
 
     except subprocess.CalledProcessError:
         pytest.skip("Not authenticated with Globus CLI - run 'globus login'")
+    except subprocess.TimeoutExpired:
+        pytest.skip("Globus CLI did not respond to 'globus session show'")
 
 
 def _get_auth_params_for_service(globus_auth_config, globus_tokens, service):
@@ -305,24 +463,14 @@ def _get_auth_params_for_service(globus_auth_config, globus_tokens, service):
         service: Service name (e.g., 'groups', 'transfer', 'flows', 'compute')
 
     Returns:
-        YAML-formatted string with authentication parameters
+        YAML-formatted string with authentication parameters, or None if no
+        token is available for the service
     """
     auth_method = globus_auth_config["method"]
 
-    # Map service names to resource servers
-    service_to_resource_server = {
-        "groups": "groups.api.globus.org",
-        "transfer": "transfer.api.globus.org",
-        "flows": "flows.globus.org",
-        "compute": "funcx_service",
-        "timers": "524230d7-ea86-4a52-8312-86065a9e0417",  # Timers have their own resource server
-        "auth": "auth.globus.org",  # Auth/Projects use auth resource server
-        "search": "search.api.globus.org",  # Search index management
-    }
-
     if auth_method == "s3_tokens" or auth_method == "cli":
         # Use access token for the specific service
-        resource_server = service_to_resource_server.get(service)
+        resource_server = SERVICE_TO_RESOURCE_SERVER.get(service)
         if not resource_server:
             pytest.fail(f"Unknown service: {service}")
 
@@ -332,8 +480,7 @@ def _get_auth_params_for_service(globus_auth_config, globus_tokens, service):
         if access_token:
             return f"""auth_method: access_token
         access_token: {access_token}"""
-        else:
-            pytest.fail(f"No {service} token available")
+        return None
 
     elif auth_method == "client_credentials":
         return f"""auth_method: client_credentials
@@ -343,8 +490,39 @@ def _get_auth_params_for_service(globus_auth_config, globus_tokens, service):
     return "auth_method: cli"
 
 
+@pytest.fixture(scope="session")
+def _auth_params_by_service(globus_auth_config, globus_tokens):
+    """Map each service to its auth params, built once per session."""
+    return {
+        service: _get_auth_params_for_service(
+            globus_auth_config, globus_tokens, service
+        )
+        for service in SERVICE_TO_RESOURCE_SERVER
+    }
+
+
+def _auth_params_for(auth_params_by_service, service):
+    """Return precomputed auth params for a service, failing if it has no token."""
+    auth_params = auth_params_by_service[service]
+    if auth_params is None:
+        pytest.fail(f"No {service} token available")
+    return auth_params
+
+
+@pytest.fixture(scope="session")
+def ansible_playbook_auth_params_for(_auth_params_by_service):
+    """
+    Look up Ansible playbook authentication parameters by service name.
+
+    Returns a callable, e.g. ``ansible_playbook_auth_params_for("transfer")``,
+    that returns the YAML string for that service. The per-service fixtures
+    below are kept as shortcuts for it.
+    """
+    return functools.partial(_auth_params_for, _auth_params_by_service)
+
+
 @pytest.fixture
-def ansible_playbook_auth_params(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params(ansible_playbook_auth_params_for):
     """
     Generate Ansible playbook authentication parameters for groups service.
 
@@ -353,40 +531,40 @@ def ansible_playbook_auth_params(globus_auth_config, globus_tokens):
     For backwards compatibility, this returns groups auth params.
     Use service-specific fixtures for other services.
     """
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "groups")
+    return ansible_playbook_auth_params_for("groups")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_transfer(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_transfer(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for transfer service."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "transfer")
+    return ansible_playbook_auth_params_for("transfer")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_flows(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_flows(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for flows service."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "flows")
+    return ansible_playbook_auth_params_for("flows")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_compute(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_compute(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for compute service."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "compute")
+    return ansible_playbook_auth_params_for("compute")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_timers(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_timers(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for timers service."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "timers")
+    return ansible_playbook_auth_params_for("timers")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_auth(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_auth(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for auth service (projects/policies)."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "auth")
+    return ansible_playbook_auth_params_for("auth")
 
 
 @pytest.fixture
-def ansible_playbook_auth_params_search(globus_auth_config, globus_tokens):
+def ansible_playbook_auth_params_search(ansible_playbook_auth_params_for):
     """Generate Ansible playbook authentication parameters for search service."""
-    return _get_auth_params_for_service(globus_auth_config, globus_tokens, "search")
+    return ansible_playbook_auth_params_for("search")
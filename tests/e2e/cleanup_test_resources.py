@@ -4,9 +4,17 @@ Cleanup script for test resources left behind by failed E2E tests.
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import json
 import logging
 import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from globus_sdk import (
     AccessTokenAuthorizer,
@@ -20,6 +28,134 @@ from globus_sdk import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson is optional; fall back to the stdlib json module when it is absent
+try:
+    import orjson
+
+    def json_dumps(obj):
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# Concurrent Globus API calls when finding or deleting resources
+MAX_WORKERS = 8
+
+CLEANUP_SCOPES = [
+    "urn:globus:auth:scope:transfer.api.globus.org:all",
+    "urn:globus:auth:scope:groups.api.globus.org:all",
+    "urn:globus:auth:scope:compute.api.globus.org:all",
+    "urn:globus:auth:scope:flows.api.globus.org:all",
+]
+
+# Client-credentials tokens are cached here between cleanup runs
+TOKEN_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "ansible-globus"
+)
+
+# Cached tokens expiring within this many seconds are not reused
+TOKEN_EXPIRY_MARGIN = 60
+
+
+def _token_cache_path(client_id, scopes):
+    """Return the token cache file for a client and scope set."""
+    cache_id = f"{client_id}|{','.join(sorted(scopes))}"
+    digest = hashlib.sha256(cache_id.encode()).hexdigest()[:16]
+    return TOKEN_CACHE_DIR / f"cleanup-{digest}.json"
+
+
+def _load_cached_tokens(path):
+    """Return cached tokens if every one is still valid, else None."""
+    try:
+        tokens = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    deadline = time.time() + TOKEN_EXPIRY_MARGIN
+    if not tokens or any(
+        (token_data.get("expires_at_seconds") or 0) < deadline
+        for token_data in tokens.values()
+    ):
+        return None
+    return tokens
+
+
+def _save_cached_tokens(path, tokens):
+    """Write tokens to the cache file, readable only by the owner."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp creates a uniquely named 0600 file, so concurrent cleanup runs
+    # never share a temp path
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(json_dumps(tokens))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _get_tokens(client_id, client_secret):
+    """Get access tokens by resource server, reusing cached ones if valid."""
+    cache_path = _token_cache_path(client_id, CLEANUP_SCOPES)
+    tokens = _load_cached_tokens(cache_path)
+    if tokens is not None:
+        return tokens
+
+    auth_client = ConfidentialAppAuthClient(client_id, client_secret)
+    token_response = auth_client.oauth2_client_credentials_tokens(
+        requested_scopes=CLEANUP_SCOPES
+    )
+    tokens = {
+        resource_server: {
+            "access_token": data["access_token"],
+            "expires_at_seconds": data.get("expires_at_seconds"),
+        }
+        for resource_server, data in token_response.by_resource_server.items()
+    }
+    _save_cached_tokens(cache_path, tokens)
+    return tokens
+
+
+@functools.lru_cache(maxsize=4)
+def _build_clients(client_id, client_secret):
+    """
+    Build the Globus SDK clients for a set of credentials.
+
+    Cached so every cleaner in the process shares the same clients and their
+    HTTP connection pools. Returns (transfer, groups, compute, flows); compute
+    and flows are None if no token was granted for them.
+    """
+    tokens = _get_tokens(client_id, client_secret)
+
+    # Create clients
+    transfer_token = tokens["transfer.api.globus.org"]["access_token"]
+    groups_token = tokens["groups.api.globus.org"]["access_token"]
+
+    transfer_client = TransferClient(authorizer=AccessTokenAuthorizer(transfer_token))
+    groups_client = GroupsClient(authorizer=AccessTokenAuthorizer(groups_token))
+
+    # Optional clients (may not have permissions)
+    try:
+        compute_token = tokens["compute.api.globus.org"]["access_token"]
+        compute_client = ComputeClient(authorizer=AccessTokenAuthorizer(compute_token))
+    except KeyError:
+        compute_client = None
+        logger.warning("No compute access token available")
+
+    try:
+        flows_token = tokens["flows.api.globus.org"]["access_token"]
+        flows_client = FlowsClient(authorizer=AccessTokenAuthorizer(flows_token))
+    except KeyError:
+        flows_client = None
+        logger.warning("No flows access token available")
+
+    return transfer_client, groups_client, compute_client, flows_client
+
 
 class TestResourceCleaner:
     """Clean up test resources from Globus services."""
@@ -31,211 +167,226 @@ class TestResourceCleaner:
 
     def _setup_clients(self):
         """Set up Globus SDK clients."""
-        auth_client = ConfidentialAppAuthClient(self.client_id, self.client_secret)
-
-        # Get tokens
-        token_response = auth_client.oauth2_client_credentials_tokens(
-            requested_scopes=[
-                "urn:globus:auth:scope:transfer.api.globus.org:all",
-                "urn:globus:auth:scope:groups.api.globus.org:all",
-                "urn:globus:auth:scope:compute.api.globus.org:all",
-                "urn:globus:auth:scope:flows.api.globus.org:all",
-            ]
-        )
-
-        # Create clients
-        transfer_token = token_response.by_resource_server["transfer.api.globus.org"][
-            "access_token"
-        ]
-        groups_token = token_response.by_resource_server["groups.api.globus.org"][
-            "access_token"
-        ]
+        (
+            self.transfer_client,
+            self.groups_client,
+            self.compute_client,
+            self.flows_client,
+        ) = _build_clients(self.client_id, self.client_secret)
 
-        self.transfer_client = TransferClient(
-            authorizer=AccessTokenAuthorizer(transfer_token)
-        )
-        self.groups_client = GroupsClient(
-            authorizer=AccessTokenAuthorizer(groups_token)
-        )
-
-        # Optional clients (may not have permissions)
-        try:
-            compute_token = token_response.by_resource_server["compute.api.globus.org"][
-                "access_token"
-            ]
-            self.compute_client = ComputeClient(
-                authorizer=AccessTokenAuthorizer(compute_token)
+    def find_test_resources(self, test_id=None):
+        """
+        Find all test resources, optionally filtered by test ID.
+
+        Returns a (resources, counts) pair, where counts maps each resource
+        type to the number of resources found.
+        """
+        # Services are queried concurrently; collections are listed per
+        # endpoint once the endpoint search has returned
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            endpoints_future = executor.submit(self._find_endpoints, test_id)
+            groups_future = executor.submit(self._find_groups, test_id)
+            compute_future = executor.submit(self._find_compute_endpoints, test_id)
+            flows_future = executor.submit(self._find_flows, test_id)
+
+            endpoints = endpoints_future.result()
+            collections = executor.map(
+                functools.partial(self._find_collections, test_id=test_id), endpoints
             )
-        except KeyError:
-            self.compute_client = None
-            logger.warning("No compute access token available")
 
+            test_resources = {
+                "endpoints": endpoints,
+                "collections": [c for found in collections for c in found],
+                "groups": groups_future.result(),
+                "compute_endpoints": compute_future.result(),
+                "flows": flows_future.result(),
+            }
+
+        counts = {key: len(items) for key, items in test_resources.items()}
+        return test_resources, counts
+
+    def _find_endpoints(self, test_id=None):
+        """Find test endpoints."""
+        # Let the server narrow the search to this test run when possible
+        search = "e2e-test-endpoint"
+        if test_id is not None:
+            search = f"{search}-{test_id}"
         try:
-            flows_token = token_response.by_resource_server["flows.api.globus.org"][
-                "access_token"
+            endpoints = self.transfer_client.endpoint_search(filter_fulltext=search)
+            return [
+                endpoint
+                for endpoint in endpoints
+                if test_id is None or test_id in endpoint["display_name"]
             ]
-            self.flows_client = FlowsClient(
-                authorizer=AccessTokenAuthorizer(flows_token)
-            )
-        except KeyError:
-            self.flows_client = None
-            logger.warning("No flows access token available")
-
-    def find_test_resources(self, test_id=None):
-        """Find all test resources, optionally filtered by test ID."""
-        test_resources = {
-            "endpoints": [],
-            "collections": [],
-            "groups": [],
-            "compute_endpoints": [],
-            "flows": [],
-        }
-
-        # Find test endpoints
-        try:
-            endpoints = self.transfer_client.endpoint_search(
-                filter_fulltext="e2e-test-endpoint"
-            )
-            for endpoint in endpoints:
-                if test_id is None or test_id in endpoint["display_name"]:
-                    test_resources["endpoints"].append(endpoint)
         except Exception as e:
             logger.error(f"Error finding endpoints: {e}")
+            return []
 
-        # Find test collections
+    def _find_collections(self, endpoint, test_id=None):
+        """Find test collections on an endpoint."""
         try:
-            for endpoint in test_resources["endpoints"]:
-                collections = self.transfer_client.operation_ls(endpoint["id"])
-                for collection in collections:
-                    if "e2e-test-collection" in collection.get("name", "") and (
-                        test_id is None or test_id in collection["name"]
-                    ):
-                        test_resources["collections"].append(collection)
+            collections = self.transfer_client.operation_ls(endpoint["id"])
+            return [
+                collection
+                for collection in collections
+                if "e2e-test-collection" in collection.get("name", "")
+                and (test_id is None or test_id in collection["name"])
+            ]
         except Exception as e:
             logger.error(f"Error finding collections: {e}")
+            return []
 
-        # Find test groups
+    def _find_groups(self, test_id=None):
+        """Find test groups."""
         try:
             groups = self.groups_client.get_my_groups()
-            for group in groups:
+            return [
+                group
+                for group in groups
                 if (
                     "e2e-research-group" in group["name"]
                     or "idempotency-test" in group["name"]
-                ) and (test_id is None or test_id in group["name"]):
-                    test_resources["groups"].append(group)
+                )
+                and (test_id is None or test_id in group["name"])
+            ]
         except Exception as e:
             logger.error(f"Error finding groups: {e}")
+            return []
+
+    def _find_compute_endpoints(self, test_id=None):
+        """Find test compute endpoints."""
+        if not self.compute_client:
+            return []
+        try:
+            compute_endpoints = self.compute_client.get_endpoints()
+            return [
+                endpoint
+                for endpoint in compute_endpoints
+                if "e2e-compute" in endpoint["name"]
+                and (test_id is None or test_id in endpoint["name"])
+            ]
+        except Exception as e:
+            logger.error(f"Error finding compute endpoints: {e}")
+            return []
+
+    def _find_flows(self, test_id=None):
+        """Find test flows."""
+        if not self.flows_client:
+            return []
+        search = "e2e-test-flow"
+        if test_id is not None:
+            search = f"{search}-{test_id}"
+        try:
+            flows = self.flows_client.list_flows(filter_fulltext=search)
+            return [
+                flow
+                for flow in flows
+                if "e2e-test-flow" in flow["title"]
+                and (test_id is None or test_id in flow["title"])
+            ]
+        except Exception as e:
+            logger.error(f"Error finding flows: {e}")
+            return []
 
-        # Find test compute endpoints
-        if self.compute_client:
-            try:
-                compute_endpoints = self.compute_client.get_endpoints()
-                for endpoint in compute_endpoints:
-                    if "e2e-compute" in endpoint["name"] and (
-                        test_id is None or test_id in endpoint["name"]
-                    ):
-                        test_resources["compute_endpoints"].append(endpoint)
-            except Exception as e:
-                logger.error(f"Error finding compute endpoints: {e}")
-
-        # Find test flows
-        if self.flows_client:
-            try:
-                flows = self.flows_client.list_flows()
-                for flow in flows:
-                    if "e2e-test-flow" in flow["title"] and (
-                        test_id is None or test_id in flow["title"]
-                    ):
-                        test_resources["flows"].append(flow)
-            except Exception as e:
-                logger.error(f"Error finding flows: {e}")
-
-        return test_resources
+    def _delete_one(self, kind, name_field, id_field, client, method, item):
+        """Delete a single resource and return its (outcome, entry) pair."""
+        name = item[name_field]
+        try:
+            getattr(client, method)(item[id_field])
+            return "success", (kind, name)
+        except Exception as e:
+            logger.error("Failed to delete %s %s: %s", kind.replace("_", " "), name, e)
+            return "failed", (kind, name, str(e))
 
     def delete_test_resources(self, test_resources, dry_run=False):
         """Delete test resources."""
         deleted = {"success": [], "failed": []}
 
-        # Delete flows first
-        for flow in test_resources["flows"]:
-            try:
-                if not dry_run:
-                    self.flows_client.delete_flow(flow["id"])
-                logger.info(
-                    f"{'Would delete' if dry_run else 'Deleted'} flow: {flow['title']}"
-                )
-                deleted["success"].append(("flow", flow["title"]))
-            except Exception as e:
-                logger.error(f"Failed to delete flow {flow['title']}: {e}")
-                deleted["failed"].append(("flow", flow["title"], str(e)))
-
-        # Delete collections
-        for collection in test_resources["collections"]:
-            try:
-                if not dry_run:
-                    self.transfer_client.delete_endpoint(collection["id"])
-                logger.info(
-                    f"{'Would delete' if dry_run else 'Deleted'} collection: {collection['name']}"
-                )
-                deleted["success"].append(("collection", collection["name"]))
-            except Exception as e:
-                logger.error(f"Failed to delete collection {collection['name']}: {e}")
-                deleted["failed"].append(("collection", collection["name"], str(e)))
-
-        # Delete endpoints
-        for endpoint in test_resources["endpoints"]:
-            try:
-                if not dry_run:
-                    self.transfer_client.delete_endpoint(endpoint["id"])
-                logger.info(
-                    f"{'Would delete' if dry_run else 'Deleted'} endpoint: {endpoint['display_name']}"
-                )
-                deleted["success"].append(("endpoint", endpoint["display_name"]))
-            except Exception as e:
-                logger.error(
-                    f"Failed to delete endpoint {endpoint['display_name']}: {e}"
-                )
-                deleted["failed"].append(("endpoint", endpoint["display_name"], str(e)))
-
-        # Delete compute endpoints
-        for endpoint in test_resources["compute_endpoints"]:
-            try:
-                if not dry_run:
-                    self.compute_client.delete_endpoint(endpoint["uuid"])
-                logger.info(
-                    f"{'Would delete' if dry_run else 'Deleted'} compute endpoint: {endpoint['name']}"
-                )
-                deleted["success"].append(("compute_endpoint", endpoint["name"]))
-            except Exception as e:
-                logger.error(
-                    f"Failed to delete compute endpoint {endpoint['name']}: {e}"
-                )
-                deleted["failed"].append(("compute_endpoint", endpoint["name"], str(e)))
-
-        # Delete groups last
-        for group in test_resources["groups"]:
-            try:
-                if not dry_run:
-                    self.groups_client.delete_group(group["id"])
-                logger.info(
-                    f"{'Would delete' if dry_run else 'Deleted'} group: {group['name']}"
+        # Flows first and groups last; each phase finishes before the next
+        # starts, while resources within a phase are deleted concurrently
+        phases = [
+            ("flow", "flows", "title", "id", self.flows_client, "delete_flow"),
+            (
+                "collection",
+                "collections",
+                "name",
+                "id",
+                self.transfer_client,
+                "delete_endpoint",
+            ),
+            (
+                "endpoint",
+                "endpoints",
+                "display_name",
+                "id",
+                self.transfer_client,
+                "delete_endpoint",
+            ),
+            (
+                "compute_endpoint",
+                "compute_endpoints",
+                "name",
+                "uuid",
+                self.compute_client,
+                "delete_endpoint",
+            ),
+            ("group", "groups", "name", "id", self.groups_client, "delete_group"),
+        ]
+
+        if dry_run:
+            # Nothing is deleted, so every resource simply counts as a success
+            deleted["success"] = [
+                (kind, item[name_field])
+                for kind, key, name_field, *_ in phases
+                for item in test_resources[key]
+            ]
+            logger.info("Would delete %d resources", len(deleted["success"]))
+            return deleted
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for kind, key, name_field, id_field, client, method in phases:
+                items = test_resources[key]
+                if not items:
+                    continue
+
+                delete_one = functools.partial(
+                    self._delete_one,
+                    kind,
+                    name_field,
+                    id_field,
+                    client,
+                    method,
                 )
-                deleted["success"].append(("group", group["name"]))
-            except Exception as e:
-                logger.error(f"Failed to delete group {group['name']}: {e}")
-                deleted["failed"].append(("group", group["name"], str(e)))
+                names = []
+                for outcome, entry in executor.map(delete_one, items):
+                    deleted[outcome].append(entry)
+                    if outcome == "success":
+                        names.append(entry[1])
+
+                # One summary line per phase rather than one per resource
+                if names:
+                    logger.info(
+                        "Deleted %d %s(s): %s",
+                        len(names),
+                        kind.replace("_", " "),
+                        ", ".join(names),
+                    )
 
         return deleted
 
-    def list_resources(self, test_id=None):
-        """List all test resources."""
-        resources = self.find_test_resources(test_id)
+    def list_resources(self, test_id=None, found=None):
+        """
+        List all test resources, finding them unless already provided.
+
+        ``found`` is a (resources, counts) pair from find_test_resources.
+        """
+        resources, counts = found or self.find_test_resources(test_id)
 
         print("Found test resources:")
         print("=" * 50)
 
         for resource_type, items in resources.items():
-            if items:
+            if counts[resource_type]:
                 print(f"\n{resource_type.upper()}:")
                 for item in items:
                     if resource_type == "endpoints":
@@ -247,10 +398,9 @@ class TestResourceCleaner:
                     elif resource_type == "flows":
                         print(f"  - {item['title']} ({item['id']})")
 
-        total = sum(len(items) for items in resources.values())
-        print(f"\nTotal resources found: {total}")
+        print(f"\nTotal resources found: {sum(counts.values())}")
 
-        return resources
+        return resources, counts
 
 
 def main():
@@ -259,7 +409,11 @@ def main():
         "--list", action="store_true", help="List test resources without deleting"
     )
     parser.add_argument(
-        "--test-id", type=str, help="Clean resources for specific test ID only"
+        "--test-id",
+        "--run-id",
+        dest="test_id",
+        type=str,
+        help="Clean resources for a specific test ID, or every test in an E2E run",
     )
     parser.add_argument(
         "--all", action="store_true", help="Clean ALL test resources (dangerous!)"
@@ -298,8 +452,8 @@ def main():
         cleaner.list_resources(args.test_id)
     else:
         # Find resources to delete
-        resources = cleaner.find_test_resources(args.test_id)
-        total = sum(len(items) for items in resources.values())
+        resources, counts = cleaner.find_test_resources(args.test_id)
+        total = sum(counts.values())
 
         if total == 0:
             logger.info("No test resources found")
@@ -307,7 +461,7 @@ def main():
 
         # Show what will be deleted
         print(f"Found {total} test resources to delete:")
-        cleaner.list_resources(args.test_id)
+        cleaner.list_resources(found=(resources, counts))
 
         # Confirm deletion
         if not args.all and not args.dry_run:
@@ -3,38 +3,68 @@
 End-to-end tests for complete Globus infrastructure deployment.
 """
 
+import collections
+import itertools
 import json
 import os
 import subprocess
 import tempfile
-import time
+import uuid
 from pathlib import Path
 
 import pytest
 
+# Playbooks run by these tests; Ansible renders them from the vars file
+PLAYBOOKS_DIR = Path(__file__).parent / "playbooks"
 
-class TestE2EGlobusDeployment:
-    """End-to-end tests for full Globus deployment scenarios."""
+# Lines of playbook output kept for assertions and failure messages
+OUTPUT_TAIL_LINES = 1024
 
-    @pytest.fixture(scope="class")
-    def test_config(self):
-        """Configuration for E2E tests."""
-        config = {
-            "client_id": os.getenv("GLOBUS_CLIENT_ID"),
-            "client_secret": os.getenv("GLOBUS_CLIENT_SECRET"),
-            "test_scope": "test-ansible-globus",
-            "cleanup_delay": 30,  # seconds to wait before cleanup
-        }
+# Numbers the tests within a worker, giving test IDs "<run_id>-[<worker>-]<n>"
+_test_counter = itertools.count(1)
+
+
+def _next_test_id(run_id):
+    """Return a test ID unique within the run, including across xdist workers."""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    number = next(_test_counter)
+    return f"{run_id}-{worker}-{number}" if worker else f"{run_id}-{number}"
+
+
+@pytest.fixture(scope="session")
+def run_id():
+    """
+    Short ID shared by every E2E test in this pytest run.
+
+    All resources from one run share the prefix, so they can be found with a
+    single search, e.g. ``cleanup_test_resources.py --run-id <run_id>``.
+    Under pytest-xdist every worker derives it from the same test run UID.
+    """
+    testrun_uid = os.getenv("PYTEST_XDIST_TESTRUNUID")
+    return (testrun_uid or uuid.uuid4().hex)[:10]
+
+
+@pytest.fixture(scope="session")
+def test_config():
+    """Configuration for E2E tests, shared by every test class."""
+    config = {
+        "client_id": os.getenv("GLOBUS_CLIENT_ID"),
+        "client_secret": os.getenv("GLOBUS_CLIENT_SECRET"),
+        "test_scope": "test-ansible-globus",
+    }
+
+    # Validate required environment variables
+    if not config["client_id"] or not config["client_secret"]:
+        pytest.skip("GLOBUS_CLIENT_ID and GLOBUS_CLIENT_SECRET required for E2E tests")
+
+    return config
 
-        # Validate required environment variables
-        if not config["client_id"] or not config["client_secret"]:
-            pytest.skip(
-                "GLOBUS_CLIENT_ID and GLOBUS_CLIENT_SECRET required for E2E tests"
-            )
 
-        return config
+@pytest.mark.e2e
+class TestE2EGlobusDeployment:
+    """End-to-end tests for full Globus deployment scenarios."""
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture
     def temp_workspace(self):
         """Create temporary workspace for test artifacts."""
         workspace = tempfile.mkdtemp(prefix="globus-e2e-")
@@ -45,385 +75,79 @@ class TestE2EGlobusDeployment:
 
         shutil.rmtree(workspace)
 
-    def create_test_playbook(self, workspace, playbook_content, name="test.yml"):
-        """Create a test playbook file."""
-        playbook_path = workspace / name
-        with open(playbook_path, "w") as f:
-            f.write(playbook_content)
-        return str(playbook_path)
+    def create_vars_file(self, workspace, test_config, **extra_vars):
+        """Write playbook variables, including credentials, to a private file."""
+        variables = {
+            "globus_client_id": test_config["client_id"],
+            "globus_client_secret": test_config["client_secret"],
+            **extra_vars,
+        }
+        vars_path = workspace / "vars.json"
+        fd = os.open(vars_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(variables, f)
+        return str(vars_path)
 
-    def run_ansible_playbook(self, playbook_path, extra_vars=None, expect_success=True):
+    def run_ansible_playbook(self, playbook_name, vars_file=None, expect_success=True):
         """Run Ansible playbook and return results."""
-        cmd = ["ansible-playbook", playbook_path, "-v", "--connection", "local"]
+        playbook_path = PLAYBOOKS_DIR / playbook_name
+        cmd = ["ansible-playbook", str(playbook_path), "-v", "--connection", "local"]
 
-        if extra_vars:
-            cmd.extend(["-e", json.dumps(extra_vars)])
+        # Variables are passed by file so credentials stay out of argv
+        if vars_file:
+            cmd.extend(["-e", f"@{vars_file}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Stream output and keep only the tail, which holds the PLAY RECAP
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        ) as proc:
+            tail = collections.deque(proc.stdout, maxlen=OUTPUT_TAIL_LINES)
+        result = subprocess.CompletedProcess(cmd, proc.returncode, "".join(tail))
 
         if expect_success and result.returncode != 0:
-            pytest.fail(
-                f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
-            )
+            pytest.fail(f"Playbook failed:\nOUTPUT: {result.stdout}")
 
         return result
 
-    def test_complete_research_infrastructure(self, test_config, temp_workspace):
+    def test_complete_research_infrastructure(
+        self, test_config, temp_workspace, run_id
+    ):
         """Test complete research infrastructure deployment."""
 
         # Generate unique identifiers for this test run
-        import uuid
-
-        test_id = str(uuid.uuid4())[:8]
-
-        playbook_content = f"""
----
-- name: E2E Test - Complete Research Infrastructure
-  hosts: localhost
-  connection: local
-  gather_facts: false
-  vars:
-    test_id: "{test_id}"
-    globus_client_id: "{test_config['client_id']}"
-    globus_client_secret: "{test_config['client_secret']}"
-
-  tasks:
-    # Phase 1: Create Research Group
-    - name: Create research group
-      globus_group:
-        name: "e2e-research-group-{{{{ test_id }}}}"
-        description: "E2E test research group"
-        visibility: "private"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: present
-      register: research_group
-
-    - name: Verify group creation
-      assert:
-        that:
-          - research_group.changed
-          - research_group.group_id is defined
-
-    # Phase 2: Create Endpoint
-    - name: Create test endpoint
-      globus_endpoint:
-        name: "e2e-test-endpoint-{{{{ test_id }}}}"
-        description: "E2E test endpoint"
-        organization: "Ansible E2E Test"
-        contact_email: "test@example.com"
-        endpoint_type: "personal"
-        public: false
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: present
-      register: test_endpoint
-
-    - name: Verify endpoint creation
-      assert:
-        that:
-          - test_endpoint.changed
-          - test_endpoint.endpoint_id is defined
-
-    # Phase 3: Create Collections
-    - name: Create test collection
-      globus_collection:
-        name: "e2e-test-collection-{{{{ test_id }}}}"
-        endpoint_id: "{{{{ test_endpoint.endpoint_id }}}}"
-        path: "/tmp/test-data"
-        collection_type: "mapped"
-        description: "E2E test collection"
-        public: false
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: present
-      register: test_collection
-
-    - name: Verify collection creation
-      assert:
-        that:
-          - test_collection.changed
-          - test_collection.collection_id is defined
-
-    # Phase 4: Create Compute Endpoint (if supported)
-    - name: Create compute endpoint
-      globus_compute:
-        name: "e2e-compute-{{{{ test_id }}}}"
-        description: "E2E test compute endpoint"
-        public: false
-        executor_type: "ThreadPoolExecutor"
-        max_workers: 2
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: present
-      register: compute_endpoint
-      ignore_errors: true  # Compute may not be available in test environment
-
-    # Phase 5: Create Flow (if compute available)
-    - name: Create test flow
-      globus_flow:
-        title: "e2e-test-flow-{{{{ test_id }}}}"
-        description: "E2E test automation flow"
-        definition:
-          Comment: "Simple test flow"
-          StartAt: "TestStep"
-          States:
-            TestStep:
-              Type: "Pass"
-              Result: "E2E test completed"
-              End: true
-        visible_to:
-          - "{{{{ research_group.group_id }}}}"
-        runnable_by:
-          - "{{{{ research_group.group_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: present
-      register: test_flow
-      when: compute_endpoint is succeeded
-
-    # Phase 6: Verification
-    - name: Display deployment summary
-      debug:
-        msg: |
-          E2E Deployment Summary:
-          Group ID: {{{{ research_group.group_id }}}}
-          Endpoint ID: {{{{ test_endpoint.endpoint_id }}}}
-          Collection ID: {{{{ test_collection.collection_id }}}}
-          Compute ID: {{{{ compute_endpoint.endpoint_id | default('N/A') }}}}
-          Flow ID: {{{{ test_flow.flow_id | default('N/A') }}}}
-
-    # Phase 7: Cleanup
-    - name: Wait before cleanup
-      pause:
-        seconds: {test_config['cleanup_delay']}
-
-    - name: Delete test flow
-      globus_flow:
-        title: "e2e-test-flow-{{{{ test_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: absent
-      when: test_flow is defined and test_flow is succeeded
-      ignore_errors: true
-
-    - name: Delete test collection
-      globus_collection:
-        name: "e2e-test-collection-{{{{ test_id }}}}"
-        endpoint_id: "{{{{ test_endpoint.endpoint_id }}}}"
-        path: "/tmp/test-data"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: absent
-      ignore_errors: true
-
-    - name: Delete test endpoint
-      globus_endpoint:
-        name: "e2e-test-endpoint-{{{{ test_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: absent
-      ignore_errors: true
-
-    - name: Delete research group
-      globus_group:
-        name: "e2e-research-group-{{{{ test_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: absent
-      ignore_errors: true
-
-    - name: Delete compute endpoint
-      globus_compute:
-        name: "e2e-compute-{{{{ test_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{{{{ globus_client_id }}}}"
-        client_secret: "{{{{ globus_client_secret }}}}"
-        state: absent
-      when: compute_endpoint is succeeded
-      ignore_errors: true
-"""
+        test_id = _next_test_id(run_id)
 
-        playbook_path = self.create_test_playbook(
-            temp_workspace, playbook_content, "complete_deployment.yml"
-        )
+        vars_file = self.create_vars_file(temp_workspace, test_config, test_id=test_id)
 
         # Run the complete deployment test
-        result = self.run_ansible_playbook(playbook_path)
+        result = self.run_ansible_playbook("complete_deployment.yml", vars_file)
 
         # Verify successful execution
         assert "PLAY RECAP" in result.stdout
         assert "failed=0" in result.stdout or result.returncode == 0
 
-    def test_idempotency_verification(self, test_config, temp_workspace):
+    def test_idempotency_verification(self, test_config, temp_workspace, run_id):
         """Test that operations are truly idempotent."""
 
-        test_id = str(time.time()).replace(".", "")
-
-        playbook_content = f"""
----
-- name: E2E Test - Idempotency
-  hosts: localhost
-  connection: local
-  gather_facts: false
-  vars:
-    test_id: "{test_id}"
-
-  tasks:
-    - name: Create group (first time)
-      globus_group:
-        name: "idempotency-test-{{{{ test_id }}}}"
-        description: "Idempotency test group"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: present
-      register: first_run
-
-    - name: Create same group (second time)
-      globus_group:
-        name: "idempotency-test-{{{{ test_id }}}}"
-        description: "Idempotency test group"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: present
-      register: second_run
-
-    - name: Verify idempotency
-      assert:
-        that:
-          - first_run.changed
-          - not second_run.changed
-          - first_run.group_id == second_run.group_id
-
-    - name: Cleanup
-      globus_group:
-        name: "idempotency-test-{{{{ test_id }}}}"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: absent
-      ignore_errors: true
-"""
+        test_id = _next_test_id(run_id)
 
-        playbook_path = self.create_test_playbook(
-            temp_workspace, playbook_content, "idempotency.yml"
-        )
+        vars_file = self.create_vars_file(temp_workspace, test_config, test_id=test_id)
 
-        result = self.run_ansible_playbook(playbook_path)
+        result = self.run_ansible_playbook("idempotency.yml", vars_file)
         assert "failed=0" in result.stdout or result.returncode == 0
 
     def test_error_handling(self, test_config, temp_workspace):
         """Test proper error handling for invalid operations."""
+        vars_file = self.create_vars_file(temp_workspace, test_config)
 
-        playbook_content = f"""
----
-- name: E2E Test - Error Handling
-  hosts: localhost
-  connection: local
-  gather_facts: false
-
-  tasks:
-    - name: Try to create collection without endpoint
-      globus_collection:
-        name: "invalid-collection"
-        endpoint_id: "00000000-0000-0000-0000-000000000000"
-        path: "/invalid/path"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: present
-      register: invalid_collection
-      ignore_errors: true
-
-    - name: Verify error was caught
-      assert:
-        that:
-          - invalid_collection.failed
-          - invalid_collection.msg is defined
-
-    - name: Try invalid authentication
-      globus_group:
-        name: "auth-test"
-        auth_method: "client_credentials"
-        client_id: "invalid"
-        client_secret: "invalid"
-        state: present
-      register: invalid_auth
-      ignore_errors: true
-
-    - name: Verify auth error was caught
-      assert:
-        that:
-          - invalid_auth.failed
-          - '"Authentication failed" in invalid_auth.msg or "failed" in invalid_auth.msg'
-"""
-
-        playbook_path = self.create_test_playbook(
-            temp_workspace, playbook_content, "error_handling.yml"
-        )
-
-        result = self.run_ansible_playbook(playbook_path)
+        result = self.run_ansible_playbook("error_handling.yml", vars_file)
         assert "failed=0" in result.stdout or result.returncode == 0
 
     def test_check_mode(self, test_config, temp_workspace):
         """Test check mode functionality."""
+        vars_file = self.create_vars_file(temp_workspace, test_config, check=True)
 
-        playbook_content = f"""
----
-- name: E2E Test - Check Mode
-  hosts: localhost
-  connection: local
-  gather_facts: false
-
-  tasks:
-    - name: Create group in check mode
-      globus_group:
-        name: "check-mode-test"
-        description: "Should not be created"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: present
-      check_mode: true
-      register: check_result
-
-    - name: Verify check mode behavior
-      assert:
-        that:
-          - check_result.changed
-          - check_result.group_id is not defined
-
-    - name: Verify group was not created
-      globus_group:
-        name: "check-mode-test"
-        auth_method: "client_credentials"
-        client_id: "{test_config['client_id']}"
-        client_secret: "{test_config['client_secret']}"
-        state: absent
-      register: cleanup
-
-    - name: Verify no cleanup needed
-      assert:
-        that:
-          - not cleanup.changed
-"""
-
-        playbook_path = self.create_test_playbook(
-            temp_workspace, playbook_content, "check_mode.yml"
-        )
-
-        result = self.run_ansible_playbook(playbook_path, extra_vars={"check": True})
+        result = self.run_ansible_playbook("check_mode.yml", vars_file)
         assert result.returncode == 0
 
 
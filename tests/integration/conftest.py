@@ -7,14 +7,40 @@ Note: Coverage is disabled for integration tests because modules execute
 in separate Ansible subprocesses where pytest-cov cannot track them.
 """
 
+import itertools
 import json
+import logging
 import os
-import shutil
+import random
 import subprocess
 import tempfile
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
+import yaml
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# In-memory filesystem used for throwaway playbooks when present
+TMPFS_DIR = Path("/dev/shm")
+
+# AWS instance discovery attempts, with exponential backoff between them
+DISCOVERY_ATTEMPTS = 3
+DISCOVERY_MAX_DELAY = 30
+
+# SSH options for test playbooks only; replaces ansible.cfg's ssh_args, so
+# the host key options from there are repeated. A persistent master
+# connection lets tasks against the GCS host reuse one SSH session, and
+# going straight to key auth skips probing GSSAPI/password methods first.
+TEST_SSH_ARGS = (
+    "-o StrictHostKeyChecking=accept-new -o UserKnownHostsFile=/dev/null "
+    "-o ControlMaster=auto -o ControlPersist=60s "
+    "-o PreferredAuthentications=publickey"
+)
+
+logger = logging.getLogger("ansible_globus.tests.integration")
 
 
 @pytest.fixture(scope="session")
@@ -26,72 +52,152 @@ def aws_gcs_instance_discovery():
     Uses boto3 with environment AWS credentials (works with OIDC).
 
     This allows tests to dynamically discover the test instance IP
-    instead of using hardcoded values.
+    instead of using hardcoded values. Instances that are found are cached
+    for the session, so each name is looked up at most once. Transient AWS
+    errors are retried with exponential backoff before giving up.
     """
+    discovered = {}
+    ec2 = None
 
-    def _discover_instance(instance_name="ansible-test-gcs-01"):
-        try:
-            import boto3
-        except ImportError:
-            pytest.skip("boto3 not available for instance discovery")
-
-        try:
-            # Use default credential chain (supports OIDC, environment vars, etc.)
-            ec2 = boto3.client("ec2", region_name=os.getenv("AWS_REGION", "us-east-1"))
-
-            # Query instances by Name tag
-            response = ec2.describe_instances(
-                Filters=[
-                    {"Name": "tag:Name", "Values": [instance_name]},
-                    {"Name": "instance-state-name", "Values": ["running", "pending"]},
-                ]
+    # Resolve the optional boto3 dependency once for the session
+    try:
+        import boto3
+        from botocore.config import Config
+        from botocore.exceptions import NoCredentialsError
+    except ImportError:
+        boto3 = None
+
+    def _find_running_instance(instance_name):
+        nonlocal ec2
+        # Use default credential chain (supports OIDC, environment vars, etc.)
+        # The client (and its connection pool) is shared for the session.
+        # Short timeouts and no botocore retries: failed attempts are retried
+        # with backoff by _discover_instance instead.
+        if ec2 is None:
+            ec2 = boto3.client(
+                "ec2",
+                region_name=os.getenv("AWS_REGION", "us-east-1"),
+                config=Config(
+                    connect_timeout=3, read_timeout=5, retries={"max_attempts": 1}
+                ),
             )
 
-            # Extract instance from reservations
-            instances = []
-            for reservation in response.get("Reservations", []):
-                instances.extend(reservation.get("Instances", []))
+        # Query instances by Name tag; results are paginated
+        pages = ec2.get_paginator("describe_instances").paginate(
+            Filters=[
+                {"Name": "tag:Name", "Values": [instance_name]},
+                # Pending instances cannot be reached over SSH yet
+                {"Name": "instance-state-name", "Values": ["running"]},
+            ],
+            PaginationConfig={"PageSize": 100},
+        )
+
+        # Take the first matching instance without fetching further pages
+        return next(
+            (
+                instance
+                for page in pages
+                for reservation in page.get("Reservations", [])
+                for instance in reservation.get("Instances", [])
+            ),
+            None,
+        )
 
-            if not instances:
-                return None
+    def _discover_instance(instance_name="ansible-test-gcs-01"):
+        if instance_name in discovered:
+            return discovered[instance_name]
+
+        if boto3 is None:
+            pytest.skip("boto3 not available for instance discovery")
 
-            # Return first running instance
-            instance = instances[0]
-            return {
-                "instance_id": instance.get("InstanceId"),
-                "public_ip": instance.get("PublicIpAddress"),
-                "private_ip": instance.get("PrivateIpAddress"),
-                "state": instance.get("State", {}).get("Name"),
-            }
-
-        except Exception as e:
-            # If AWS discovery fails, return None to allow fallback
-            print(f"Warning: AWS instance discovery failed: {e}")
+        for attempt in range(DISCOVERY_ATTEMPTS):
+            try:
+                instance = _find_running_instance(instance_name)
+                break
+            except NoCredentialsError as e:
+                # Retrying cannot help without credentials
+                logger.warning("AWS instance discovery failed: %s", e)
+                return None
+            except Exception as e:
+                if attempt == DISCOVERY_ATTEMPTS - 1:
+                    # If AWS discovery fails, return None to allow fallback
+                    logger.warning("AWS instance discovery failed: %s", e)
+                    return None
+                # Exponential backoff with jitter: ~1s, ~2s, ...
+                delay = min(2**attempt, DISCOVERY_MAX_DELAY) + random.uniform(0, 0.5)
+                logger.warning(
+                    "AWS instance discovery failed (%s), retrying in %.1fs", e, delay
+                )
+                time.sleep(delay)
+
+        if instance is None:
             return None
 
+        discovered[instance_name] = {
+            "instance_id": instance.get("InstanceId"),
+            "public_ip": instance.get("PublicIpAddress"),
+            "private_ip": instance.get("PrivateIpAddress"),
+            "state": instance.get("State", {}).get("Name"),
+        }
+        return discovered[instance_name]
+
     return _discover_instance
 
 
+@dataclass(frozen=True)
+class GlobusEnv:
+    """Globus settings of the test session, resolved once."""
+
+    sdk_version: str
+    client_id: str | None
+    identity_urn: str | None
+
+
 @pytest.fixture(scope="session")
-def sdk_version():
+def globus_env():
     """
-    Get the current Globus SDK major version.
+    Resolve the Globus SDK version and test credentials once per session.
 
-    Used to create unique resource names per SDK version when tests
-    run in parallel (e.g., SDK 3 and SDK 4 integration tests).
+    ``client_id`` and ``identity_urn`` are None when GLOBUS_CLIENT_ID and
+    GLOBUS_CLIENT_SECRET are not both set.
     """
     try:
         import globus_sdk
 
-        version = globus_sdk.__version__
-        major = version.split(".")[0]
-        return f"sdk{major}"
+        sdk_version = f"sdk{globus_sdk.__version__.split('.')[0]}"
     except ImportError:
-        return "sdk0"
+        sdk_version = "sdk0"
+
+    # Get credentials from environment
+    client_id = os.getenv("GLOBUS_CLIENT_ID")
+    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
+
+    identity_urn = None
+    if client_id and client_secret:
+        # For a service account/client credentials, we use the client identity
+        # which is in the format: <client_id>@clients.auth.globus.org
+        identity_urn = f"urn:globus:auth:identity:{client_id}@clients.auth.globus.org"
+
+    return GlobusEnv(
+        sdk_version=sdk_version,
+        client_id=client_id if identity_urn else None,
+        identity_urn=identity_urn,
+    )
+
+
+@pytest.fixture(scope="session")
+def sdk_version(globus_env):
+    """
+    Get the current Globus SDK major version.
+
+    Used to create unique resource names per SDK version when tests
+    run in parallel (e.g., SDK 3 and SDK 4 integration tests).
+    """
+    return globus_env.sdk_version
 
 
 @pytest.fixture(scope="session")
-def test_user_identity():
+def test_user_identity(globus_env):
     """
     Get the current test user's Globus identity.
 
@@ -100,31 +206,29 @@ def test_user_identity():
 
     Returns the identity URN for use in role assignments and other tests.
     """
-    # Get credentials from environment
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-
-    if not client_id or not client_secret:
+    if globus_env.identity_urn is None:
         pytest.skip("GLOBUS_CLIENT_ID and GLOBUS_CLIENT_SECRET required")
-
-    # For a service account/client credentials, we use the client identity
-    # which is in the format: <client_id>@clients.auth.globus.org
-    identity_urn = f"urn:globus:auth:identity:{client_id}@clients.auth.globus.org"
-
-    return identity_urn
+    return globus_env.identity_urn
 
 
 @pytest.fixture
-def test_playbooks_dir():
-    """Create temporary directory for test playbooks."""
-    temp_dir = tempfile.mkdtemp()
-    playbooks_dir = Path(temp_dir) / "playbooks"
-    playbooks_dir.mkdir()
+def test_playbooks_dir(tmp_path):
+    """
+    Create temporary directory for test playbooks.
 
-    yield playbooks_dir
+    Uses the in-memory /dev/shm when available (e.g. Linux CI runners) so
+    writing playbooks does not touch disk, falling back to tmp_path.
+    """
+    if not TMPFS_DIR.is_dir():
+        playbooks_dir = tmp_path / "playbooks"
+        playbooks_dir.mkdir()
+        yield playbooks_dir
+        return
 
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    with tempfile.TemporaryDirectory(
+        prefix="ansible-test-playbooks-", dir=TMPFS_DIR
+    ) as playbooks_dir:
+        yield Path(playbooks_dir)
 
 
 @pytest.fixture
@@ -140,72 +244,269 @@ def create_playbook(test_playbooks_dir):
     return _create_playbook
 
 
-@pytest.fixture
-def run_playbook():
+@pytest.fixture(scope="session")
+def _ansible_collections_path(tmp_path_factory):
     """
-    Fixture that returns a function to run ansible-playbook.
+    Collections path that exposes this checkout as m1yag1.globus.
 
-    IMPORTANT: Extracts host from playbook and uses it as inventory.
-    Without this, playbooks skip with "no hosts matched" but still return exit code 0.
+    For FQCN like m1yag1.globus.globus_gcs, Ansible expects
+    <collections_path>/ansible_collections/<namespace>/<name>, so the
+    structure is created once per session with a symlink to the project root.
+    """
+    collections_root = tmp_path_factory.mktemp("ansible_test_collections")
+    namespace_path = collections_root / "ansible_collections" / "m1yag1"
+    namespace_path.mkdir(parents=True)
+    (namespace_path / "globus").symlink_to(PROJECT_ROOT)
+    return str(collections_root)
+
+
+def _inventory_for(plays, source):
+    """
+    Build a host-list inventory from the ``hosts`` of the given plays.
+
+    The trailing comma tells ansible this is a host list, not a file.
+    """
+    hosts = []
+    for play in plays or []:
+        play_hosts = play.get("hosts")
+        if isinstance(play_hosts, str):
+            play_hosts = play_hosts.split(",")
+        for host in play_hosts or []:
+            if host not in hosts:
+                hosts.append(host)
+    if not hosts:
+        raise ValueError(f"Could not find 'hosts:' in playbook {source}")
+    return ",".join(hosts) + ","
+
+
+@pytest.fixture(scope="session")
+def _ssh_control_path_dir(tmp_path_factory):
+    """
+    Directory for SSH ControlMaster sockets, shared by the whole session.
+
+    Each xdist worker gets its own directory instead of piling sockets up
+    in ~/.ansible/cp. The path stays short enough for Unix socket names.
     """
+    return str(tmp_path_factory.mktemp("sshcp"))
+
+
+def _ansible_env(collections_path, control_path_dir):
+    """Environment for ansible-playbook subprocesses."""
+    # Pass through environment variables
+    env = os.environ.copy()
+
+    # Set ANSIBLE_COLLECTIONS_PATH to use local module code
+    env["ANSIBLE_COLLECTIONS_PATH"] = collections_path
+
+    # Keep persistent SSH master sockets in the session's control path dir
+    env["ANSIBLE_SSH_CONTROL_PATH_DIR"] = control_path_dir
+    env["ANSIBLE_SSH_ARGS"] = TEST_SSH_ARGS
+
+    # Use the project's ansible.cfg (SSH pipelining)
+    # regardless of the directory pytest was started from
+    env["ANSIBLE_CONFIG"] = str(PROJECT_ROOT / "ansible.cfg")
 
-    def _run_playbook(playbook_path, extra_vars=None):
-        # Read playbook to extract the host
-        # This ensures ansible-playbook actually runs against the target
-        with open(playbook_path) as f:
-            content = f.read()
-            # Extract host from "- hosts: X" line
-            import re
+    # Opt-in Mitogen strategy (USE_MITOGEN=1, requires `pip install mitogen`)
+    # keeps one remote Python interpreter alive instead of one per task
+    if os.environ.get("USE_MITOGEN") == "1":
+        import ansible_mitogen
 
-            host_match = re.search(r"hosts:\s+([^\s]+)", content)
-            if not host_match:
-                raise ValueError(f"Could not find 'hosts:' in playbook {playbook_path}")
+        plugins_dir = Path(ansible_mitogen.__file__).parent / "plugins"
+        env["ANSIBLE_STRATEGY_PLUGINS"] = str(plugins_dir / "strategy")
+        env["ANSIBLE_STRATEGY"] = "mitogen_linear"
 
-            host = host_match.group(1).strip()
+    return env
 
-            # Use comma-separated host list as inventory
-            # The trailing comma tells ansible this is a host list, not a file
-            cmd = ["ansible-playbook", "-i", f"{host},", playbook_path, "-v"]
+
+class _PlaybookResult:
+    """
+    CompletedProcess-like result whose output lives in log files.
+
+    stdout/stderr are only read (and decoded) when a test accesses them,
+    which is normally just to report a failure.
+    """
+
+    def __init__(self, args, returncode, stdout_path, stderr_path):
+        self.args = args
+        self.returncode = returncode
+        self.stdout_path = stdout_path
+        self.stderr_path = stderr_path
+
+    @property
+    def stdout(self):
+        return self.stdout_path.read_text(errors="replace")
+
+    @property
+    def stderr(self):
+        return self.stderr_path.read_text(errors="replace")
+
+
+def _playbook_runner(collections_path, control_path_dir, log_dir):
+    """Build a run_playbook function that keeps its files in ``log_dir``."""
+    run_numbers = itertools.count(1)
+
+    def _run_playbook(
+        playbook_path,
+        extra_vars=None,
+        required_env=("GLOBUS_CLIENT_ID", "GLOBUS_CLIENT_SECRET"),
+        inventory=None,
+    ):
+        # Skip before paying for Ansible startup if the playbook's
+        # credentials are not configured
+        missing = [name for name in required_env if not os.environ.get(name)]
+        if missing:
+            pytest.skip(f"Missing required environment variables: {missing}")
+
+        if inventory:
+            # Explicit host for playbooks written against `hosts: all`
+            inventory = f"{inventory},"
+        else:
+            # Read playbook to extract the host
+            # This ensures ansible-playbook actually runs against the target
+            with open(playbook_path) as f:
+                plays = yaml.safe_load(f)
+            inventory = _inventory_for(plays, playbook_path)
+
+        cmd = ["ansible-playbook", "-i", inventory, str(playbook_path)]
+
+        # Verbose output is opt-in; tests only look at it when debugging
+        if os.environ.get("ANSIBLE_TEST_VERBOSE"):
+            cmd.append("-v")
 
         # Use python3 discovery on the remote host
         # The remote host needs Python 3 with globus_sdk installed
         # We use 'auto_legacy' which will discover python3 automatically
         cmd.extend(["-e", "ansible_python_interpreter=auto_legacy"])
 
+        run_number = next(run_numbers)
         if extra_vars:
-            cmd.extend(["-e", json.dumps(extra_vars)])
+            # Pass vars through a private file so credentials stay off the
+            # ansible-playbook command line
+            vars_path = log_dir / f"playbook-{run_number}.vars.json"
+            fd = os.open(vars_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(extra_vars, f)
+            cmd.extend(["-e", f"@{vars_path}"])
+
+        env = _ansible_env(collections_path, control_path_dir)
+        env.setdefault("ANSIBLE_STDOUT_CALLBACK", "minimal")
+        stdout_path = log_dir / f"playbook-{run_number}.stdout.log"
+        stderr_path = log_dir / f"playbook-{run_number}.stderr.log"
+        with open(stdout_path, "wb") as out, open(stderr_path, "wb") as err:
+            result = subprocess.run(cmd, stdout=out, stderr=err, env=env)
+        return _PlaybookResult(cmd, result.returncode, stdout_path, stderr_path)
+
+    return _run_playbook
+
+
+@pytest.fixture
+def run_playbook(_ansible_collections_path, _ssh_control_path_dir, tmp_path):
+    """
+    Fixture that returns a function to run ansible-playbook.
+
+    IMPORTANT: Extracts host from playbook and uses it as inventory, unless an
+    explicit ``inventory`` host is passed (for playbooks using ``hosts: all``).
+    Without this, playbooks skip with "no hosts matched" but still return exit code 0.
+
+    Output is streamed to per-run log files under the test's tmp_path
+    rather than held in memory. Tests are skipped without running Ansible
+    when any variable in ``required_env`` is unset.
+    """
+    return _playbook_runner(_ansible_collections_path, _ssh_control_path_dir, tmp_path)
+
+
+@pytest.fixture(scope="session")
+def session_run_playbook(
+    _ansible_collections_path, _ssh_control_path_dir, tmp_path_factory
+):
+    """
+    Session-scoped run_playbook, for session fixture setup and teardown.
+
+    Logs are written to a session-wide ``session_playbooks`` tmp directory.
+    """
+    log_dir = tmp_path_factory.mktemp("session_playbooks")
+    return _playbook_runner(_ansible_collections_path, _ssh_control_path_dir, log_dir)
+
 
-        # Pass through environment variables
-        env = os.environ.copy()
+@dataclass(frozen=True)
+class BatchedPlaybookResult:
+    """Outcome of a run_playbooks call."""
 
-        # Set ANSIBLE_COLLECTIONS_PATH to use local module code
-        # For FQCN like m1yag1.globus.globus_gcs, we need to create the proper
-        # collection directory structure
-        project_root = Path(__file__).parent.parent.parent
+    returncode: int
+    # One entry per play from the json stdout callback:
+    # {"play": ..., "tasks": [...]}
+    plays: list
+    stdout: str
+    stderr: str
 
-        # Create a temporary collections path structure with symlinks
-        # Ansible expects: <collections_path>/ansible_collections/<namespace>/<name>
-        collections_temp = Path(tempfile.gettempdir()) / "ansible_test_collections"
-        collection_path = collections_temp / "ansible_collections" / "m1yag1" / "globus"
 
-        # Create directory structure and symlink to project root
-        collection_path.parent.mkdir(parents=True, exist_ok=True)
-        if collection_path.exists() or collection_path.is_symlink():
-            if collection_path.is_symlink():
-                collection_path.unlink()
-            elif collection_path.is_dir():
-                import shutil
+@pytest.fixture
+def run_playbooks(_ansible_collections_path, _ssh_control_path_dir, test_playbooks_dir):
+    """
+    Fixture that returns a function to run several playbooks in one go.
 
-                shutil.rmtree(collection_path)
-        collection_path.symlink_to(project_root)
+    Takes a list of ``(content, extra_vars)`` pairs, merges all of their
+    plays into a single playbook and runs ansible-playbook once, so the
+    interpreter startup is paid once instead of per playbook. Each pair's
+    extra_vars become play-level ``vars`` of its own plays.
 
-        # Set ANSIBLE_COLLECTIONS_PATH to our temp directory
-        env["ANSIBLE_COLLECTIONS_PATH"] = str(collections_temp)
+    ``inventory`` and ``required_env`` behave as for run_playbook. Returns a
+    BatchedPlaybookResult; a host that fails in one play is skipped by the
+    following plays, as with any multi-play playbook.
+    """
 
+    def _run_playbooks(
+        playbooks,
+        required_env=("GLOBUS_CLIENT_ID", "GLOBUS_CLIENT_SECRET"),
+        inventory=None,
+    ):
+        missing = [name for name in required_env if not os.environ.get(name)]
+        if missing:
+            pytest.skip(f"Missing required environment variables: {missing}")
+
+        plays = []
+        for content, extra_vars in playbooks:
+            for play in yaml.safe_load(content) or []:
+                if extra_vars:
+                    play["vars"] = {**play.get("vars", {}), **extra_vars}
+                plays.append(play)
+
+        # Play vars may hold credentials, so the file is private
+        playbook_path = test_playbooks_dir / "batched_playbook.yml"
+        fd = os.open(playbook_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            yaml.safe_dump(plays, f, sort_keys=False)
+
+        if inventory:
+            inventory = f"{inventory},"
+        else:
+            inventory = _inventory_for(plays, playbook_path)
+
+        cmd = [
+            "ansible-playbook",
+            "-i",
+            inventory,
+            str(playbook_path),
+            "-e",
+            "ansible_python_interpreter=auto_legacy",
+        ]
+
+        env = _ansible_env(_ansible_collections_path, _ssh_control_path_dir)
+        env["ANSIBLE_STDOUT_CALLBACK"] = "json"
         result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-        return result
 
-    return _run_playbook
+        try:
+            results = json.loads(result.stdout)["plays"]
+        except (ValueError, KeyError):
+            pytest.fail(
+                f"ansible-playbook produced no JSON output "
+                f"(rc={result.returncode}): {result.stderr}"
+            )
+        return BatchedPlaybookResult(
+            result.returncode, results, result.stdout, result.stderr
+        )
+
+    return _run_playbooks
 
 
 def pytest_configure(config):
@@ -40,16 +40,22 @@ Test Strategy:
     2. Create storage gateway (resource_type: storage_gateway)
     3. Create collection (resource_type: collection)
     4. Manage roles (resource_type: role)
-    5. Each test cleans up its own resources
+    5. Each test registers its resources with gcs_cleanup, which deletes
+       them all in one playbook run at the end of the session
 """
 
+import logging
 import os
+from collections import namedtuple
+from pathlib import Path
 
 import pytest
 
 # Marker for GCS tests - requires deployed GCS infrastructure
 pytestmark = pytest.mark.gcs
 
+logger = logging.getLogger("ansible_globus.tests.integration")
+
 
 def _get_test_suffix():
     """Get unique suffix for resource names to avoid parallel test collisions.
@@ -83,8 +89,50 @@ def _get_test_suffix():
 # race conditions when parallel CI jobs run against the same GCS instance
 SDK_SUFFIX = _get_test_suffix()
 
+# Playbooks run against the GCS host; values come from gcs_playbook_vars
+PLAYBOOKS_DIR = Path(__file__).parent / "playbooks" / "gcs"
+
+# GCS resources each playbook creates, registered with gcs_cleanup;
+# test_gcs_full_lifecycle runs the playbooks in this order
+PLAYBOOK_RESOURCES = {
+    "storage_gateway": [
+        ("storage_gateway", f"Test POSIX Gateway{SDK_SUFFIX}"),
+    ],
+    "gateway_idempotency": [
+        ("storage_gateway", f"Test Idempotent Gateway{SDK_SUFFIX}"),
+    ],
+    "collection": [
+        ("collection", f"Test Collection{SDK_SUFFIX}"),
+        ("storage_gateway", f"Gateway for Collection Test{SDK_SUFFIX}"),
+    ],
+    "collection_update": [
+        ("collection", f"Collection to Update{SDK_SUFFIX}"),
+        ("storage_gateway", f"Gateway for Update Test{SDK_SUFFIX}"),
+    ],
+    "roles": [
+        ("collection", f"Collection for Role Test{SDK_SUFFIX}"),
+        ("storage_gateway", f"Gateway for Role Test{SDK_SUFFIX}"),
+    ],
+    "role_idempotency": [
+        ("collection", f"Collection for Role Idempotency{SDK_SUFFIX}"),
+        ("storage_gateway", f"Gateway for Role Idempotency Test{SDK_SUFFIX}"),
+    ],
+    "ha_gateway_collection": [
+        ("collection", f"HA Test Collection{SDK_SUFFIX}"),
+        ("storage_gateway", f"HA Test Gateway{SDK_SUFFIX}"),
+    ],
+}
+
+# Run each GCS playbook as its own test instead of one composite run
+# (slower, but failures are isolated to a single test)
+RUN_INDIVIDUAL = os.getenv("GCS_RUN_INDIVIDUAL", "0") == "1"
+individual = pytest.mark.skipif(
+    not RUN_INDIVIDUAL,
+    reason="Covered by test_gcs_full_lifecycle (set GCS_RUN_INDIVIDUAL=1)",
+)
+
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def gcs_host(aws_gcs_instance_discovery):
     """
     Get GCS test host dynamically or from environment.
@@ -118,13 +166,13 @@ def gcs_host(aws_gcs_instance_discovery):
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def gcs_ssh_user():
     """Get SSH user for GCS test instance."""
     return os.getenv("TEST_GCS_SSH_USER", "ubuntu")
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def gcs_project_id():
     """Get Globus project ID for GCS endpoint."""
     project_id = os.getenv(
@@ -133,7 +181,7 @@ def gcs_project_id():
     return project_id
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def gcs_subscription_id():
     """Get GCS subscription ID."""
     subscription_id = os.getenv(
@@ -142,14 +190,89 @@ def gcs_subscription_id():
     return subscription_id
 
 
+GcsCredentials = namedtuple("GcsCredentials", "client_id client_secret sdk_env")
+
+
+@pytest.fixture(scope="session")
+def gcs_credentials():
+    """Get Globus client credentials and SDK environment for GCS playbooks."""
+    return GcsCredentials(
+        os.getenv("GLOBUS_CLIENT_ID"),
+        os.getenv("GLOBUS_CLIENT_SECRET"),
+        os.getenv("GLOBUS_SDK_ENVIRONMENT", "production"),
+    )
+
+
+@pytest.fixture(scope="session")
+def gcs_playbook_vars(gcs_credentials, gcs_project_id, gcs_subscription_id):
+    """Extra vars consumed by the GCS test playbooks in PLAYBOOKS_DIR."""
+    return {
+        "globus_client_id": gcs_credentials.client_id,
+        "globus_client_secret": gcs_credentials.client_secret,
+        "globus_sdk_environment": gcs_credentials.sdk_env,
+        "sdk_suffix": SDK_SUFFIX,
+        "gcs_project_id": gcs_project_id,
+        "gcs_subscription_id": gcs_subscription_id,
+        # Shared identity mapping, passed inline instead of copying a JSON
+        # file to the GCS host in every playbook
+        "gcs_identity_mapping": {
+            "DATA_TYPE": "expression_identity_mapping#1.0.0",
+            "mappings": [
+                {
+                    "source": "{username}",
+                    "match": "art",
+                    "output": "ubuntu",
+                    "literal": True,
+                },
+                {
+                    "source": "{id}",
+                    "match": gcs_credentials.client_id,
+                    "output": "ubuntu",
+                    "literal": True,
+                },
+                {"source": "{username}", "match": "(.*)", "output": "{0}"},
+            ],
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def gcs_cleanup(gcs_host, gcs_playbook_vars, session_run_playbook):
+    """
+    Collect GCS resources to delete once at the end of the session.
+
+    Tests append ``(resource_type, display_name)`` pairs. All of them are
+    deleted by a single run of the cleanup playbook instead of per-test
+    cleanup tasks; it deletes all collections before any gateway.
+    """
+    resources = []
+    yield resources
+
+    if not resources:
+        return
+
+    result = session_run_playbook(
+        PLAYBOOKS_DIR / "cleanup.yml",
+        extra_vars={
+            **gcs_playbook_vars,
+            "gcs_cleanup_resources": [
+                {"resource_type": resource_type, "display_name": display_name}
+                for resource_type, display_name in resources
+            ],
+        },
+        required_env=(),
+        inventory=gcs_host,
+    )
+    if result.returncode != 0:
+        logger.warning("GCS cleanup playbook failed: %s", result.stdout)
+
+
 @pytest.mark.skip(
     reason="Endpoint is static infrastructure - set up via infra/setup-gcs-endpoint.yml"
 )
 def test_gcs_endpoint_setup(
     gcs_host,
-    gcs_project_id,
-    gcs_subscription_id,
-    create_playbook,
+    gcs_playbook_vars,
     run_playbook,
 ):
     """
@@ -162,58 +285,15 @@ def test_gcs_endpoint_setup(
     that should be set up once via infra/setup-gcs-endpoint.yml, not recreated
     by each test run.
     """
-    # Get client credentials from environment
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: false
-  gather_facts: true
-  tasks:
-    - name: Setup GCS endpoint
-      m1yag1.globus.globus_gcs:
-        resource_type: endpoint
-        display_name: "Ansible Test GCS Endpoint"
-        organization: "Test Organization"
-        department: "Engineering"
-        description: "Test endpoint for ansible-globus GCS module integration tests"
-        contact_email: "test@example.com"
-        project_id: "{gcs_project_id}"
-        subscription_id: "{gcs_subscription_id}"
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: endpoint_result
-
-    - name: Verify endpoint was created
-      assert:
-        that:
-          - endpoint_result.changed
-          - endpoint_result.endpoint_id is defined
-          - endpoint_result.endpoint_domain is defined
-
-    - name: Save endpoint info for other tests
-      set_fact:
-        test_endpoint_id: "{{{{ endpoint_result.endpoint_id }}}}"
-        test_endpoint_domain: "{{{{ endpoint_result.endpoint_domain }}}}"
-
-    - name: Display endpoint details
-      debug:
-        msg:
-          - "Endpoint ID: {{{{ endpoint_result.endpoint_id }}}}"
-          - "Endpoint Domain: {{{{ endpoint_result.endpoint_domain }}}}"
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_gcs_endpoint.yml")
-    result = run_playbook(playbook_path)
+    result = run_playbook(
+        PLAYBOOKS_DIR / "gcs_endpoint.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
 @pytest.mark.skip(
@@ -223,7 +303,7 @@ def test_gcs_endpoint_setup(
 @pytest.mark.gcs
 def test_gcs_node_setup(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
     run_playbook,
 ):
     """
@@ -236,46 +316,22 @@ def test_gcs_node_setup(
     Marked as slow because it takes several minutes and requires sudo.
     Requires an endpoint to already be configured.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    - name: Setup GCS node
-      m1yag1.globus.globus_gcs:
-        resource_type: node
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: node_result
-
-    - name: Verify node was configured
-      assert:
-        that:
-          - node_result.changed or node_result.msg == "Node already configured"
-
-    - name: Display node setup result
-      debug:
-        msg: "Node setup: {{{{ node_result.msg }}}}"
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_gcs_node.yml")
-    result = run_playbook(playbook_path)
+    result = run_playbook(
+        PLAYBOOKS_DIR / "gcs_node.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_storage_gateway_create(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -284,113 +340,23 @@ def test_gcs_storage_gateway_create(
     This test creates a storage gateway on the GCS endpoint using the
     globus_gcs_storage_gateway module.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing gateway from previous runs
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test POSIX Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create test data directory
-      file:
-        path: /test-data
-        state: directory
-        mode: '0755'
-        owner: root
-        group: root
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{id}}",
-                "match": "{client_id}",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping.json
-
-    - name: Create POSIX storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test POSIX Gateway{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: gateway_result
-
-    - name: Verify storage gateway was created
-      assert:
-        that:
-          - gateway_result.changed
-          - gateway_result.storage_gateway_id is defined
-          - "'Test POSIX Gateway' in gateway_result.display_name"
-          - gateway_result.storage_type is defined
-
-    - name: Display gateway details
-      debug:
-        msg:
-          - "Gateway ID: {{{{ gateway_result.storage_gateway_id }}}}"
-          - "Display Name: {{{{ gateway_result.display_name }}}}"
-
-    # Cleanup
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test POSIX Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_storage_gateway.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["storage_gateway"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "storage_gateway.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_storage_gateway_idempotency(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -398,105 +364,23 @@ def test_gcs_storage_gateway_idempotency(
 
     Creating the same gateway twice should not change anything.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing gateway from previous runs
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test Idempotent Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping-idem.json
-
-    - name: Create POSIX storage gateway (first time)
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test Idempotent Gateway{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-idem.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: first_run
-
-    - name: Create same storage gateway (second time)
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test Idempotent Gateway{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-idem.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: second_run
-
-    - name: Verify idempotency
-      assert:
-        that:
-          - first_run.changed
-          - not second_run.changed
-          - first_run.storage_gateway_id == second_run.storage_gateway_id
-
-    # Cleanup
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Test Idempotent Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_gateway_idempotency.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["gateway_idempotency"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "gateway_idempotency.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_collection_create(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -504,279 +388,45 @@ def test_gcs_collection_create(
 
     This test creates a collection using the globus_gcs_collection module.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing resources from previous runs
-    - name: Delete existing test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Test Collection{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Collection Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping-collection.json
-
-    - name: Create storage gateway for collection
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Collection Test{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-collection.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: gateway_result
-
-    - name: Create mapped collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Test Collection{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        description: "Test collection for integration tests"
-        public: false
-        delete_protection: false
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: collection_result
-
-    - name: Verify collection was created
-      assert:
-        that:
-          - collection_result.changed
-          - collection_result.collection_id is defined
-          - "'Test Collection' in collection_result.display_name"
-
-    - name: Display collection details
-      debug:
-        msg:
-          - "Collection ID: {{{{ collection_result.collection_id }}}}"
-          - "Display Name: {{{{ collection_result.display_name }}}}"
-
-    # Cleanup
-    - name: Delete test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Test Collection{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Collection Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_collection.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["collection"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "collection.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_collection_update(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
     Test updating a collection's metadata.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing resources from previous runs
-    - name: Delete existing test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection to Update{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Update Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping-collection-update.json
-
-    - name: Create storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Update Test{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-collection-update.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: gateway_result
-
-    - name: Create collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection to Update{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        description: "Original description"
-        delete_protection: false
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: create_result
-
-    - name: Update collection description
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        collection_id: "{{{{ create_result.collection_id }}}}"
-        display_name: "Collection to Update{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        description: "Updated description"
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: update_result
-
-    - name: Verify collection was updated
-      assert:
-        that:
-          - update_result.changed
-          - update_result.collection_id == create_result.collection_id
-          - update_result.description == "Updated description"
-
-    # Cleanup
-    - name: Delete test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection to Update{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Update Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_collection_update.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["collection_update"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "collection_update.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_role_assignment(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -784,146 +434,23 @@ def test_gcs_role_assignment(
 
     This test creates a collection and assigns an administrator role to art@globusid.org.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing resources from previous runs
-    - name: Delete existing test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping-roles.json
-
-    - name: Create storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Test{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-roles.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: gateway_result
-
-    - name: Create collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Test{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        delete_protection: false
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: collection_result
-
-    - name: Assign administrator role
-      m1yag1.globus.globus_gcs:
-        resource_type: role
-        collection_id: "{{{{ collection_result.collection_id }}}}"
-        principal: "art@globusid.org"
-        role: administrator
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: role_result
-
-    - name: Verify role was assigned
-      assert:
-        that:
-          - role_result.changed
-          - role_result.role == "administrator"
-
-    - name: Display role details
-      debug:
-        msg:
-          - "Role: {{{{ role_result.role }}}}"
-          - "Principal: {{{{ role_result.principal }}}}"
-
-    # Cleanup
-    - name: Delete test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_roles.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["roles"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "roles.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_role_idempotency(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -932,153 +459,23 @@ def test_gcs_role_idempotency(
     Assigning the same role twice should not change anything.
     Uses art@globusid.org for role assignments.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing resources from previous runs
-    - name: Delete existing test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Idempotency{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete existing test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Idempotency Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/identity-mapping-roles-idem.json
-
-    - name: Create storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Idempotency Test{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/identity-mapping-roles-idem.json
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: gateway_result
-
-    - name: Create collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Idempotency{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        delete_protection: false
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: collection_result
-
-    - name: Assign administrator role (first time)
-      m1yag1.globus.globus_gcs:
-        resource_type: role
-        collection_id: "{{{{ collection_result.collection_id }}}}"
-        principal: "mike.a@globus.org"
-        role: administrator
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: first_run
-
-    - name: Assign same role (second time)
-      m1yag1.globus.globus_gcs:
-        resource_type: role
-        collection_id: "{{{{ collection_result.collection_id }}}}"
-        principal: "mike.a@globus.org"
-        role: administrator
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: second_run
-
-    - name: Verify idempotency
-      assert:
-        that:
-          - first_run.changed
-          - not second_run.changed
-
-    # Cleanup
-    - name: Delete test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "Collection for Role Idempotency{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "Gateway for Role Idempotency Test{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
-
-    playbook_path = create_playbook(playbook_content, "test_role_idempotency.yml")
-    result = run_playbook(playbook_path)
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["role_idempotency"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "role_idempotency.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
 
 
+@individual
 def test_gcs_ha_storage_gateway_and_collection(
     gcs_host,
-    create_playbook,
+    gcs_playbook_vars,
+    gcs_cleanup,
     run_playbook,
 ):
     """
@@ -1088,154 +485,44 @@ def test_gcs_ha_storage_gateway_and_collection(
     timeout and a collection that requires high assurance for transfers.
     Uses the HA subscription ID which is already configured for HA support.
     """
-    client_id = os.getenv("GLOBUS_CLIENT_ID")
-    client_secret = os.getenv("GLOBUS_CLIENT_SECRET")
-    sdk_env = os.getenv("GLOBUS_SDK_ENVIRONMENT", "production")
-
-    playbook_content = f"""
----
-- hosts: {gcs_host}
-  remote_user: ubuntu
-  become: true
-  gather_facts: true
-  tasks:
-    # Cleanup any existing HA gateway and collection from previous runs
-    - name: Delete existing HA test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "HA Test Collection{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete existing HA test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "HA Test Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Create identity mapping file for HA gateway
-      copy:
-        content: |
-          {{
-            "DATA_TYPE": "expression_identity_mapping#1.0.0",
-            "mappings": [
-              {{
-                "source": "{{username}}",
-                "match": "art",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{id}}",
-                "match": "{client_id}",
-                "output": "ubuntu",
-                "literal": true
-              }},
-              {{
-                "source": "{{username}}",
-                "match": "(.*)",
-                "output": "{{0}}"
-              }}
-            ]
-          }}
-        dest: /tmp/ha-identity-mapping.json
-
-    - name: Create HA storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "HA Test Gateway{SDK_SUFFIX}"
-        storage_type: posix
-        identity_mapping: /tmp/ha-identity-mapping.json
-        high_assurance: true
-        authentication_timeout_mins: 3
-        require_mfa: false
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: ha_gateway_result
-
-    - name: Verify HA storage gateway was created
-      assert:
-        that:
-          - ha_gateway_result.changed
-          - ha_gateway_result.storage_gateway_id is defined
-          - "'HA Test Gateway' in ha_gateway_result.display_name"
-
-    - name: Display HA gateway details
-      debug:
-        msg:
-          - "HA Gateway ID: {{{{ ha_gateway_result.storage_gateway_id }}}}"
-          - "Display Name: {{{{ ha_gateway_result.display_name }}}}"
-
-    - name: Create HA collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "HA Test Collection{SDK_SUFFIX}"
-        storage_gateway_id: "{{{{ ha_gateway_result.storage_gateway_id }}}}"
-        collection_base_path: "/"
-        description: "High assurance collection for testing HA transfers"
-        public: false
-        delete_protection: false
-        require_high_assurance: true
-        state: present
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      register: ha_collection_result
-
-    - name: Verify HA collection was created
-      assert:
-        that:
-          - ha_collection_result.changed
-          - ha_collection_result.collection_id is defined
-          - "'HA Test Collection' in ha_collection_result.display_name"
-
-    - name: Display HA collection details
-      debug:
-        msg:
-          - "HA Collection ID: {{{{ ha_collection_result.collection_id }}}}"
-          - "Display Name: {{{{ ha_collection_result.display_name }}}}"
-
-    # Cleanup
-    - name: Delete HA test collection
-      m1yag1.globus.globus_gcs:
-        resource_type: collection
-        display_name: "HA Test Collection{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-
-    - name: Delete HA test storage gateway
-      m1yag1.globus.globus_gcs:
-        resource_type: storage_gateway
-        display_name: "HA Test Gateway{SDK_SUFFIX}"
-        state: absent
-      environment:
-        GLOBUS_SDK_ENVIRONMENT: "{sdk_env}"
-        GCS_CLI_CLIENT_ID: "{client_id}"
-        GCS_CLI_CLIENT_SECRET: "{client_secret}"
-      ignore_errors: true
-"""
+    gcs_cleanup.extend(PLAYBOOK_RESOURCES["ha_gateway_collection"])
+    result = run_playbook(
+        PLAYBOOKS_DIR / "ha_gateway_collection.yml",
+        extra_vars=gcs_playbook_vars,
+        inventory=gcs_host,
+    )
 
-    playbook_path = create_playbook(playbook_content, "test_ha_gateway_collection.yml")
-    result = run_playbook(playbook_path)
+    assert result.returncode == 0, (
+        f"Playbook failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
+    )
+
+
+@pytest.mark.skipif(RUN_INDIVIDUAL, reason="Running GCS playbooks individually")
+def test_gcs_full_lifecycle(
+    gcs_host,
+    gcs_playbook_vars,
+    gcs_cleanup,
+    run_playbooks,
+):
+    """
+    Run every GCS test playbook in a single ansible-playbook invocation.
+
+    run_playbooks merges the storage gateway, collection, role and HA
+    playbooks into one multi-play playbook, so Ansible starts up once for
+    the whole plan. A failing play stops the plays after it; rerun with
+    GCS_RUN_INDIVIDUAL=1 to run them as separate tests.
+    """
+    for resources in PLAYBOOK_RESOURCES.values():
+        gcs_cleanup.extend(resources)
+    result = run_playbooks(
+        [
+            ((PLAYBOOKS_DIR / f"{name}.yml").read_text(), gcs_playbook_vars)
+            for name in PLAYBOOK_RESOURCES
+        ],
+        inventory=gcs_host,
+    )
 
-    assert result.returncode == 0, f"Playbook failed: {result.stderr}"
+    assert result.returncode == 0, f"Playbook failed: {result.stdout}"
 
 
 if __name__ == "__main__":
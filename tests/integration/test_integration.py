@@ -2,40 +2,11 @@
 
 import json
 import os
-import shutil
 import subprocess
-import tempfile
-from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def test_playbooks_dir():
-    """Create temporary directory for test playbooks."""
-    temp_dir = tempfile.mkdtemp()
-    playbooks_dir = Path(temp_dir) / "playbooks"
-    playbooks_dir.mkdir()
-
-    yield playbooks_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-def create_playbook(test_playbooks_dir):
-    """Fixture that returns a function to create test playbook files."""
-
-    def _create_playbook(content, filename="test_playbook.yml"):
-        playbook_path = test_playbooks_dir / filename
-        with open(playbook_path, "w") as f:
-            f.write(content)
-        return str(playbook_path)
-
-    return _create_playbook
-
-
 @pytest.fixture
 def run_playbook():
     """Fixture that returns a function to run ansible-playbook."""
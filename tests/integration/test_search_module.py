@@ -12,11 +12,8 @@ delete indexes via the Globus web interface.
 
 import json
 import os
-import shutil
 import subprocess
 import sys
-import tempfile
-from pathlib import Path
 
 import pytest
 
@@ -29,33 +26,7 @@ def auth_method_suffix():
 
 
 @pytest.fixture
-def test_playbooks_dir():
-    """Create temporary directory for test playbooks."""
-    temp_dir = tempfile.mkdtemp()
-    playbooks_dir = Path(temp_dir) / "playbooks"
-    playbooks_dir.mkdir()
-
-    yield playbooks_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-def create_playbook(test_playbooks_dir):
-    """Fixture that returns a function to create test playbook files."""
-
-    def _create_playbook(content, filename="test_playbook.yml"):
-        playbook_path = test_playbooks_dir / filename
-        with open(playbook_path, "w") as f:
-            f.write(content)
-        return str(playbook_path)
-
-    return _create_playbook
-
-
-@pytest.fixture
-def run_playbook():
+def run_playbook(_ansible_collections_path):
     """Fixture that returns a function to run ansible-playbook for localhost tests."""
 
     def _run_playbook(playbook_path, extra_vars=None):
@@ -73,23 +44,7 @@ def run_playbook():
         env = os.environ.copy()
 
         # Set ANSIBLE_COLLECTIONS_PATH to use local module code
-        project_root = Path(__file__).parent.parent.parent
-
-        # Create a temporary collections path structure with symlinks
-        collections_temp = Path(tempfile.gettempdir()) / "ansible_test_collections"
-        collection_path = collections_temp / "ansible_collections" / "m1yag1" / "globus"
-
-        # Create directory structure and symlink to project root
-        collection_path.parent.mkdir(parents=True, exist_ok=True)
-        if collection_path.exists() or collection_path.is_symlink():
-            if collection_path.is_symlink():
-                collection_path.unlink()
-            elif collection_path.is_dir():
-                shutil.rmtree(collection_path)
-        collection_path.symlink_to(project_root)
-
-        # Set ANSIBLE_COLLECTIONS_PATH to our temp directory
-        env["ANSIBLE_COLLECTIONS_PATH"] = str(collections_temp)
+        env["ANSIBLE_COLLECTIONS_PATH"] = _ansible_collections_path
 
         result = subprocess.run(cmd, capture_output=True, text=True, env=env)
         return result
@@ -26,6 +26,7 @@ Usage:
 """
 
 import json
+import time
 import typing as t
 from datetime import datetime
 
@@ -57,6 +58,8 @@ class S3TokenStorage(StorageAdapter):
         namespace: Namespace for token partitioning (default: "DEFAULT")
         region: AWS region (default: None, uses default region)
         kms_key_id: Optional KMS key ID for encryption
+        client_id: Optional client ID recorded alongside stored tokens
+        s3_client: Optional existing boto3 S3 client to reuse
 
     Environment Variables:
         AWS_ACCESS_KEY_ID: AWS access key (if not using IAM role)
@@ -80,6 +83,7 @@ class S3TokenStorage(StorageAdapter):
         region: str | None = None,
         kms_key_id: str | None = None,
         client_id: str | None = None,
+        s3_client: t.Any = None,
     ) -> None:
         self.bucket = bucket
         self.key = key
@@ -87,8 +91,19 @@ class S3TokenStorage(StorageAdapter):
         self.kms_key_id = kms_key_id
         self.client_id = client_id
 
-        # Initialize S3 client
-        self.s3 = boto3.client("s3", region_name=region)
+        # Most recent (monotonic timestamp, data) read from S3
+        self._last_load: tuple[float, dict[str, t.Any]] | None = None
+
+        # S3 client is created on first use unless the caller shares one
+        self._region = region
+        self._s3 = s3_client
+
+    @property
+    def s3(self) -> t.Any:
+        """The boto3 S3 client, created on first access."""
+        if self._s3 is None:
+            self._s3 = boto3.client("s3", region_name=self._region)
+        return self._s3
 
     def store(self, token_response: OAuthTokenResponse) -> None:
         """
@@ -179,6 +194,39 @@ class S3TokenStorage(StorageAdapter):
 
         return False
 
+    def load_all_data(self, max_age: float = 30.0) -> dict[str, t.Any]:
+        """
+        Get the full token data structure across all namespaces.
+
+        Reuses the data from the previous S3 read if it is younger than
+        ``max_age`` seconds, so a load/modify/save cycle costs one GET.
+
+        Args:
+            max_age: Maximum age in seconds of a previous read to reuse
+
+        Returns:
+            Nested dict: {namespace: {resource_server: token_data}}
+        """
+        if self._last_load is not None:
+            loaded_at, data = self._last_load
+            if time.monotonic() - loaded_at < max_age:
+                return data
+        return self._load_from_s3()
+
+    def save_raw(self, tokens: dict[str, dict[str, t.Any]]) -> None:
+        """
+        Replace the token data for the current namespace.
+
+        Takes token entries as returned by get_all_token_data (possibly
+        updated in place), so no OAuthTokenResponse has to be rebuilt.
+
+        Args:
+            tokens: Dict mapping resource_server to token data
+        """
+        data = self.load_all_data()
+        data[self.namespace] = tokens
+        self._save_to_s3(data)
+
     def clear_namespace(self) -> None:
         """Clear all tokens in the current namespace."""
         data = self._load_from_s3()
@@ -195,14 +243,16 @@ class S3TokenStorage(StorageAdapter):
         """
         try:
             response = self.s3.get_object(Bucket=self.bucket, Key=self.key)
-            content = response["Body"].read().decode("utf-8")
-            return json.loads(content)
+            data = json.loads(response["Body"].read())
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
                 # File doesn't exist yet, return empty structure
                 return {}
             raise
 
+        self._last_load = (time.monotonic(), data)
+        return data
+
     def _save_to_s3(self, data: dict[str, dict[str, dict[str, t.Any]]]) -> None:
         """
         Save token data to S3 with encryption.
@@ -287,8 +337,6 @@ class DynamoDBTokenStorage(StorageAdapter):
 
     def store(self, token_response: OAuthTokenResponse) -> None:
         """Store token response in DynamoDB."""
-        import time
-
         ttl = int(time.time()) + (self.ttl_days * 24 * 60 * 60)
 
         for resource_server, token_data in token_response.by_resource_server.items():
@@ -134,3 +134,22 @@ class TestAuthMethodAutoDetection:
 
         # Should fall back to cli since both client_id AND secret are required
         assert client.auth_method == "cli"
+
+
+class TestUnwrapResponse:
+    """Test unwrap_response helper."""
+
+    def test_returns_data_attribute(self):
+        """Test that SDK responses are unwrapped to their data payload."""
+        from plugins.module_utils.globus_sdk_client import unwrap_response
+
+        response = mock.MagicMock()
+        response.data = {"id": "abc"}
+
+        assert unwrap_response(response) == {"id": "abc"}
+
+    def test_passes_through_plain_values(self):
+        """Test that values without a data attribute are returned unchanged."""
+        from plugins.module_utils.globus_sdk_client import unwrap_response
+
+        assert unwrap_response({"id": "abc"}) == {"id": "abc"}